@@ -6,64 +6,123 @@ from ttkbootstrap.constants import *
 from PIL import Image, ImageTk
 import subprocess
 import threading
+import concurrent.futures
 import json
 import os
+import copy
+import collections
+import weakref
+from dataclasses import dataclass
+import functools
 import re
 import socket
+import errno
+import ctypes
+import sys
+import signal
+import ipaddress
+import selectors
+import select
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import TimedRotatingFileHandler, QueueHandler, QueueListener
+import queue
 from datetime import datetime, timedelta
 import time # For retry delays
-import psutil # For system monitoring (CPU, RAM, Network)
+psutil = None # For system monitoring (CPU, RAM, Network); imported by _psutil() after the main window is on screen
+try:
+    import orjson # Optional: much faster JSON serialization for config saves
+except ImportError:
+    orjson = None
+try:
+    import ijson # Optional: incremental JSON parsing for large channels.json files
+except ImportError:
+    ijson = None
+
+# Errors raised by either JSON parser on a malformed file
+JSON_PARSE_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson is not None else (json.JSONDecodeError,)
 
 # --- Custom Tooltip Class to avoid ttkbootstrap.tooltip TypeError on older Python versions ---
 class CustomTooltip:
     """
     A custom tooltip class to provide basic tooltip functionality.
     This replaces ttkbootstrap.tooltip.Tooltip to avoid TypeError on Python < 3.10.
+    All tooltips share one hidden Toplevel that is moved and shown/withdrawn, so hovering never creates OS windows.
     """
-    def __init__(self, widget, text):
-        self.widget = widget
+    _tip_window = None # Shared tooltip window, created lazily on first hover
+    _tip_label = None
+    _tip_owner = None # The CustomTooltip currently showing in the shared window
+
+    def __init__(self, widget, text, item=None):
+        self.widget = weakref.ref(widget) # Weak, so the tooltip never keeps a destroyed widget alive
         self.text = text
-        self.tip_window = None
+        self.item = item # Optional canvas item ID; the tooltip then tracks that item instead of the whole widget
         self.id = None
         self.x = 0
         self.y = 0
-        self.widget.bind("<Enter>", self.enter)
-        self.widget.bind("<Leave>", self.leave)
-        self.widget.bind("<ButtonPress>", self.leave) # Hide on click
+        if item is None:
+            bind = widget.bind
+        else:
+            bind = functools.partial(widget.tag_bind, item)
+        bind("<Enter>", self.enter)
+        bind("<Leave>", self.leave)
+        bind("<ButtonPress>", self.leave) # Hide on click
+        widget.bind("<Destroy>", self.leave, add="+") # Reap the tip window together with its widget
 
     def enter(self, event=None):
         """Event handler for mouse entering the widget."""
+        widget = self.widget()
+        if widget is None:
+            return
         # Calculate position for the tooltip window
-        self.x = self.widget.winfo_rootx() + 20 # Offset to the right of the widget
-        self.y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5 # Offset below the widget
+        if self.item is None:
+            self.x = widget.winfo_rootx() + 20 # Offset to the right of the widget
+            self.y = widget.winfo_rooty() + widget.winfo_height() + 5 # Offset below the widget
+        else:
+            x1, y1, x2, y2 = widget.bbox(self.item)
+            self.x = widget.winfo_rootx() + x1 + 20 # Offset to the right of the item
+            self.y = widget.winfo_rooty() + y2 + 5 # Offset below the item
         self.show_tip()
 
     def leave(self, event=None):
         """Event handler for mouse leaving the widget."""
         self.hide_tip()
 
+    @classmethod
+    def _get_tip_window(cls, widget):
+        """Returns the shared tooltip window, (re)creating it if it does not exist yet for this widget's root."""
+        tip_window = cls._tip_window
+        if tip_window is None or tip_window.master is not widget.winfo_toplevel() or not tip_window.winfo_exists():
+            tip_window = tk.Toplevel(widget.winfo_toplevel())
+            tip_window.withdraw()
+            tip_window.wm_overrideredirect(True) # Removes window decorations (title bar, borders)
+            # One label inside the tooltip window, re-texted for each tooltip
+            cls._tip_label = ttk.Label(tip_window, text="", background="#ffffe0", relief=tk.SOLID, borderwidth=1,
+                                       font=("tahoma", "8", "normal"), wraplength=250) # Added wraplength for longer tooltips
+            cls._tip_label.pack(padx=1, pady=1)
+            cls._tip_window = tip_window
+        return tip_window
+
     def show_tip(self):
-        """Creates and displays the tooltip window."""
-        if self.tip_window or not self.text:
+        """Moves the shared tooltip window next to the widget and displays this tooltip's text."""
+        widget = self.widget()
+        if CustomTooltip._tip_owner is self or not self.text or widget is None:
             return
         
-        # Create a new top-level window for the tooltip
-        self.tip_window = tk.Toplevel(self.widget)
-        self.tip_window.wm_overrideredirect(True) # Removes window decorations (title bar, borders)
-        self.tip_window.wm_geometry(f"+{self.x}+{self.y}") # Set its position
-
-        # Create a label inside the tooltip window to display the text
-        label = ttk.Label(self.tip_window, text=self.text, background="#ffffe0", relief=tk.SOLID, borderwidth=1,
-                          font=("tahoma", "8", "normal"), wraplength=250) # Added wraplength for longer tooltips
-        label.pack(padx=1, pady=1)
+        tip_window = self._get_tip_window(widget)
+        CustomTooltip._tip_label.config(text=self.text)
+        tip_window.wm_geometry(f"+{self.x}+{self.y}") # Set its position
+        tip_window.deiconify()
+        tip_window.lift()
+        CustomTooltip._tip_owner = self
 
     def hide_tip(self):
-        """Destroys the tooltip window."""
-        if self.tip_window:
-            self.tip_window.destroy()
-        self.tip_window = None
+        """Withdraws the shared tooltip window if this tooltip is the one showing."""
+        if CustomTooltip._tip_owner is not self:
+            return
+        CustomTooltip._tip_owner = None
+        tip_window = CustomTooltip._tip_window
+        if tip_window is not None and tip_window.winfo_exists():
+            tip_window.withdraw()
 
 # --- Configuration File Management ---
 CONFIG_FILE = "config.json"
@@ -80,39 +139,274 @@ DEFAULT_CONFIG = {
     "default_channels_count": 10,
     "udp_packet_timeout_seconds": 10, # Timeout for UDP packet reception check (for input status)
     "udp_check_interval_seconds": 60, # Interval for checking UDP packet flow (1 minute) - Kept for manual refresh
-    "ffmpeg_process_monitor_interval_seconds": 5, # How often to check if FFmpeg process is still running
+    "ffmpeg_process_monitor_interval_seconds": 5, # Unused: FFmpeg exits are now event-driven; kept so existing config.json files stay valid
     "preview_auto_stop_seconds": 60, # New: Auto-stop preview after this many seconds
     "network_max_bandwidth_mbps": 100, # New: Max bandwidth for network utilization calculation (in Mbps)
     # "packet_loss_stop_retries": 3 # Removed: No longer automatically stopping on packet loss
 }
 
+STATUS_INDICATOR_SIZE = 20 # Edge length (px) of each channel's status square in the top bar
+# input_stream_status -> (indicator color, tooltip text); anything else ("unknown" etc.) uses the default
+STATUS_INDICATOR_STATES = {
+    "unavailable": ("red", "Input Missing / Unavailable"),
+    "streaming": ("green", "Input Present, Streaming"), # FFmpeg is running AND input is healthy
+    "available": ("yellow", "Input Present, Stream Stopped (Ready to Start)"),
+    "scanning": ("orange", "Scanning for Services..."),
+    "starting": ("blue", "Looking for Input (Waiting for Packets)"),
+}
+STATUS_INDICATOR_DEFAULT = ("grey", "Stream Not Started / Unknown Input")
+# input_stream_status -> channel button style, for the selected channel (filled) and the others (outline unless streaming)
+STATUS_BUTTON_STYLES_SELECTED = {
+    "streaming": 'success.TButton', # Green for streaming
+    "available": 'warning.TButton', # Yellow for input locked/available
+    "scanning": 'info.TButton', # Light blue/cyan for scanning
+    "unavailable": 'danger.TButton', # Red for input not locked/unavailable
+    "starting": 'primary.TButton', # Blue for looking for input
+}
+STATUS_BUTTON_DEFAULT_SELECTED = 'primary.TButton' # Default for selected but unknown status
+STATUS_BUTTON_STYLES_UNSELECTED = {
+    "streaming": 'success.TButton', # Still green if streaming
+    "unavailable": 'outline-danger.TButton',
+    "available": 'outline-warning.TButton',
+    "scanning": 'outline-info.TButton',
+    "starting": 'outline-primary.TButton',
+}
+STATUS_BUTTON_DEFAULT_UNSELECTED = 'outline-secondary.TButton' # Default outline style
+# Statuses in which the input can be previewed (packets seen, streaming, or UDP listener active)
+PREVIEWABLE_INPUT_STATUSES = frozenset(("available", "streaming", "starting"))
+UI_REFRESH_COALESCE_MS = 50 # Window in which UI refresh requests are merged into a single redraw
+SYSTEM_METRICS_INTERVAL_SECONDS = 2 # CPU/RAM/network sampling period of the background metrics thread
+BYTES_TO_MEGABITS = 8.0 / (1024 * 1024) # Network counter bytes -> megabits, as shown on the NW meter
+AUTO_START_STAGGER_MS = 200 # Spacing between auto-started streams on app launch
+APP_CONFIG_SAVE_DEBOUNCE_MS = 2000 # Delay before a channel selection is persisted to config.json; re-clicks restart it
+DISPLAY_NAME_DEBOUNCE_MS = 150 # Quiet period after the last display-name keystroke before buttons/indicators are redrawn
+YOUTUBE_URL_CACHE_TTL = 3600 # Seconds a yt-dlp resolved stream URL is reused (YouTube live URLs stay valid for hours)
+UDP_DRAIN_BATCH_SIZE = 64 # Max datagrams read from one listener socket per reactor wakeup
+# Receive buffer requested for each UDP listener so a bursty MPTS feed doesn't overflow it between reactor wakeups.
+# Linux silently caps this at net.core.rmem_max (often ~208 KiB); raise that sysctl to get the full size.
+UDP_LISTENER_RCVBUF_BYTES = 8 << 20
+UDP_TIMESTAMP_MIN_INTERVAL = 0.1 # Seconds; a live listener's last-packet timestamp is refreshed at most this often
+# Listeners only need to know that a datagram arrived. Where available, a zero-length recvmsg with MSG_TRUNC
+# dequeues it without copying the payload into a Python bytes object; Windows falls back to a plain recv.
+UDP_DISCARD_PAYLOAD = hasattr(socket.socket, "recvmsg") and hasattr(socket, "MSG_TRUNC")
+
+# Subprocess keyword templates, resolved once for this platform. Popen/run only read them, so they are shared.
+NO_WINDOW_KWARGS = {'creationflags': subprocess.CREATE_NO_WINDOW} if os.name == 'nt' else {} # Hide console windows on Windows
+STREAM_POPEN_KWARGS = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE, **NO_WINDOW_KWARGS} # ffmpeg/ffplay: stderr is monitored
+
+# FFmpeg/ffplay stderr patterns, compiled once and matched against the raw (undecoded) stderr bytes
+FFMPEG_FATAL_ERROR_RE = re.compile(
+    rb'Input/output error'
+    rb'|No such file or directory'
+    rb'|Connection refused'
+    rb'|Network is unreachable'
+    rb'|Failed to open'
+    rb'|Protocol not found'
+    rb'|Permission denied' # e.g., binding to an address without permission
+    rb'|Invalid data found when processing input',
+    re.IGNORECASE | re.ASCII) # One alternation, so each stderr line is scanned once
+FFMPEG_STDERR_WATCH_SECONDS = 5 # How long after startup FFmpeg stderr is scanned for fatal errors
+FFPLAY_STDERR_POLL_MS = 200 # How often the Tk loop drains ffplay's non-blocking stderr pipe (POSIX)
+FFMPEG_FRAME_RE = re.compile(rb'frame=\s*(\d+)', re.ASCII) # Progress line; first match means video is flowing
+# Explanations logged for advanced FFmpeg parameters: (output type it applies to or None for all, config key,
+# value required to mention it or None for "set and not '0'", template formatted with the config value)
+FFMPEG_ADVANCED_PARAM_NOTES = (
+    (None, 'input_analyzeduration', None, "-analyzeduration {}: Increases the duration FFmpeg analyzes the input to detect stream properties, improving stream stability and reducing 'no data' errors."),
+    (None, 'input_probesize', None, "-probesize {}: Increases the amount of data FFmpeg reads from the input to determine stream format and codecs, crucial for complex or fragmented inputs."),
+    (None, 'output_max_delay', None, "-max_delay {}us: Sets the maximum demuxing delay in microseconds. A higher value can help buffer against input stream fluctuations, reducing stuttering."),
+    ("SRT", 'output_srt_latency', None, "SRT latency={}ms: Buffers more data before playback, providing a larger window for retransmissions and smoothing out network jitter."),
+    ("SRT", 'output_srt_maxbw', None, "SRT maxbw={}pkts/s: Sets the maximum bandwidth for SRT in packets per second (0 for unlimited)."),
+    ("SRT", 'output_srt_tsbpdmode', "True", "SRT tsbpdmode=true: Time-Based Sender-Side Packet Delivery mode. Ensures packets are delivered based on their timestamps, improving synchronization and reducing jitter."),
+    ("SRT", 'output_srt_sndbuf', None, "SRT sndbuf={} bytes: Sets the SRT send buffer size. A larger buffer can absorb more data before transmission, reducing drops."),
+    ("SRT", 'output_srt_rcvbuf', None, "SRT rcvbuf={} bytes: Sets the SRT receive buffer size. A larger buffer helps absorb network fluctuations and retransmitted packets."),
+    ("UDP", 'output_udp_pkt_size', None, "-pkt_size {}: Sets the UDP packet size. For MPEG-TS, 1316 bytes is common to fit within typical MTU, reducing fragmentation and potential loss."),
+)
+# Static fragments of the FFmpeg command line, spliced into one list per build
+FFMPEG_DEFAULT_MAP_ARGS = ('-map', '0:v:0?', '-map', '0:a:0?') # Optional mapping when no program ID is selected
+FFMPEG_VIDEO_CODEC_ARGS = ('-c:v', 'libx264', '-pix_fmt', 'yuv420p') # Followed by '-b:v <bitrate>k'
+FFMPEG_AUDIO_MUX_ARGS = ('-c:a', 'copy', '-flags', '+global_header', '-g', '50', '-bsf:v', 'h264_mp4toannexb')
+FFMPEG_OUTPUT_FORMATS = {"RTMP": 'flv', "RTP": 'rtp'} # RTMP uses FLV container, RTP uses RTP protocol; others send MPEG-TS
+FFPLAY_WINDOW_ARGS = ('-autoexit', '-x', '640', '-y', '360') # Auto-exit when the stream ends; initial window size
+FFPLAY_INPUT_PROBE_OPTIONS = (('-analyzeduration', 'input_analyzeduration'), ('-probesize', 'input_probesize')) # (flag, config key); "0" means unset
+PROGRAM_ID_RE = re.compile(r'\(ID: (\d+)\)') # Extracts the program ID from a Program ID combobox entry
+
+class _MsgHdr(ctypes.Structure):
+    """struct msghdr (Linux ABI)."""
+    _fields_ = [("msg_name", ctypes.c_void_p), ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.c_void_p), ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p), ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int)]
+
+class _MMsgHdr(ctypes.Structure):
+    """struct mmsghdr (Linux ABI)."""
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+def _load_recvmmsg():
+    """
+    Returns a function draining up to UDP_DRAIN_BATCH_SIZE datagrams from a socket fd in one recvmmsg(2) call,
+    or None where recvmmsg is unavailable (non-Linux, or a libc without it).
+    The headers carry no iovecs, so every payload is truncated away in the kernel; only the count is returned.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        recvmmsg = ctypes.CDLL(None, use_errno=True).recvmmsg
+    except (OSError, AttributeError):
+        return None
+    recvmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+    recvmmsg.restype = ctypes.c_int
+    msgs = (_MMsgHdr * UDP_DRAIN_BATCH_SIZE)() # Zeroed headers, shared: only the UDP reactor thread calls this
+    flags = socket.MSG_DONTWAIT | socket.MSG_TRUNC
+
+    def drain(fd):
+        count = recvmmsg(fd, msgs, UDP_DRAIN_BATCH_SIZE, flags, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                return 0 # Queue already empty
+            raise OSError(err, os.strerror(err))
+        return count
+    return drain
+
+UDP_RECVMMSG_DRAIN = _load_recvmmsg() # None means the reactor falls back to one recv call per datagram
+
+def _pidfd_supported():
+    """True if os.pidfd_open works here (Python 3.9+ on Linux 5.3+), so FFmpeg exits can be watched through a selector."""
+    if not hasattr(os, "pidfd_open"):
+        return False
+    try:
+        os.close(os.pidfd_open(os.getpid()))
+    except OSError:
+        return False # e.g. ENOSYS on an older kernel
+    return True
+
+PIDFD_SUPPORTED = _pidfd_supported()
+# Without pidfds, POSIX platforms learn about child exits from SIGCHLD (delivered to a wakeup socket); Windows uses wait threads
+SIGCHLD_WAKEUP_SUPPORTED = not PIDFD_SUPPORTED and hasattr(signal, "SIGCHLD")
+
+def split_stderr_chunk(tail, data):
+    """
+    Splits a chunk of pipe output into complete stripped, non-empty lines on both '\\n' and the '\\r' FFmpeg uses for
+    progress lines. Returns (lines, new_tail); the tail is the incomplete last line, completed by the next chunk.
+    """
+    lines = (tail + data).replace(b"\r", b"\n").split(b"\n")
+    tail = lines.pop()
+    return [line for line in (raw.strip() for raw in lines) if line], tail
+
+def iter_stderr_lines(stream, chunk_size=65536, deadline=None):
+    """
+    Yields stripped, non-empty lines from a subprocess pipe.
+    Reads the pipe in large chunks (many lines per syscall) and splits on both '\\n' and the '\\r' FFmpeg uses for progress lines.
+    If deadline (a time.monotonic() value) is given, stops once it passes, even while the pipe is silent.
+    Windows pipes can't be select()ed, so there the deadline is only checked between chunks.
+    """
+    fd = stream.fileno()
+    tail = b""
+    while True:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return # Out of time; the partial tail is dropped
+            if os.name != 'nt' and not select.select([fd], [], [], remaining)[0]:
+                return # Nothing arrived before the deadline
+        data = os.read(fd, chunk_size)
+        if not data:
+            break # EOF
+        lines, tail = split_stderr_chunk(tail, data)
+        yield from lines
+    tail = tail.strip()
+    if tail:
+        yield tail
+
+def _psutil():
+    """Imports psutil on first use, keeping it off the startup path before the window first paints."""
+    global psutil
+    if psutil is None:
+        import psutil as psutil_module
+        psutil = psutil_module
+    return psutil
+
+# Resized logo PhotoImages keyed by (path, mtime, size)
+_LOGO_CACHE = {}
+
+# Parsed JSON files keyed by path: {path: ((st_mtime_ns, st_size), parsed_dict)}
+_JSON_CACHE = {}
+
+def _read_json_cached(path):
+    """Reads and parses a JSON file, returning a copy of the cached dict if the file is unchanged on disk."""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == key:
+        return copy.deepcopy(cached[1])
+    with open(path, 'r') as f:
+        data = json.load(f)
+    _JSON_CACHE[path] = (key, data)
+    return copy.deepcopy(data)
+
+def _iter_json_object_items(path):
+    """Yields (key, value) pairs of a top-level JSON object one at a time, streaming with ijson when it is installed."""
+    if ijson is None:
+        with open(path, 'r') as f:
+            yield from json.load(f).items()
+        return
+    with open(path, 'rb') as f:
+        yield from ijson.kvitems(f, "", use_float=True)
+
+def _loads_json(data):
+    """Parses JSON from bytes, using orjson when it is installed (its JSONDecodeError subclasses json's)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps_json(data):
+    """Serializes data to indented UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8") # Same layout as orjson's OPT_INDENT_2
+
+def _write_json_atomic(path, data, cache=False):
+    """
+    Serializes data once and swaps it into place, so a crash mid-save never leaves a truncated file.
+    With cache=True the written data is also kept in _JSON_CACHE, for files read back through _read_json_cached.
+    """
+    payload = _dumps_json(data)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb", buffering=0) as f:
+        f.write(payload)
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    if cache:
+        _store_json_cache(path, data)
+
+def _store_json_cache(path, data):
+    """Records freshly written data in the JSON cache so the next read does not re-parse the file."""
+    try:
+        st = os.stat(path)
+        _JSON_CACHE[path] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(data))
+    except OSError:
+        _JSON_CACHE.pop(path, None)
+
 
 def load_app_config():
     """Loads configuration from config.json, or creates it with defaults if not found."""
     if os.path.exists(CONFIG_FILE):
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
+            config = _read_json_cached(CONFIG_FILE)
             # Merge with defaults to ensure all keys are present
-            for key, default_value in DEFAULT_CONFIG.items():
-                if key not in config:
-                    config[key] = default_value
-            return config
+            return {**DEFAULT_CONFIG, **config}
         except json.JSONDecodeError:
             print(f"Error reading {CONFIG_FILE}. Creating with default settings.")
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(DEFAULT_CONFIG, f, indent=4)
+            _write_json_atomic(CONFIG_FILE, DEFAULT_CONFIG, cache=True)
             return DEFAULT_CONFIG
     else:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(DEFAULT_CONFIG, f, indent=4)
+        _write_json_atomic(CONFIG_FILE, DEFAULT_CONFIG, cache=True)
         return DEFAULT_CONFIG
 
 def save_app_config(config):
     """Saves the current application configuration to config.json."""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        _write_json_atomic(CONFIG_FILE, config, cache=True)
     except Exception as e:
         print(f"Error saving {CONFIG_FILE}: {e}") # Use print as logger might not be ready
 
@@ -120,26 +414,18 @@ def load_channels_config(default_count):
     """Loads channel configurations from channels.json, or initializes default channels."""
     if os.path.exists(CHANNELS_FILE):
         try:
-            with open(CHANNELS_FILE, 'r') as f:
-                channels = json.load(f)
-            # Ensure all default channel properties are present in loaded channels
-            for channel_name, channel_data in channels.items():
-                if "display_name" not in channel_data:
-                    channel_data["display_name"] = channel_name
-                if "input_stream_status" not in channel_data:
-                    channel_data["input_stream_status"] = "unknown"
-                if "config" not in channel_data:
-                    channel_data["config"] = {}
-                # Ensure all default config keys are present within each channel's config
-                for key, default_value in DEFAULT_CONFIG_CHANNEL_CONFIG.items():
-                    if key not in channel_data["config"]:
-                        channel_data["config"][key] = default_value
-                if "programs" not in channel_data:
-                    channel_data["programs"] = []
-                if "last_known_streaming_state" not in channel_data: # New: for auto-start
-                    channel_data["last_known_streaming_state"] = False
+            channels = {}
+            # Stream channels one at a time and ensure all default channel properties are present
+            for channel_name, channel_data in _iter_json_object_items(CHANNELS_FILE):
+                channel_data.setdefault("display_name", channel_name)
+                channel_data.setdefault("input_stream_status", "unknown")
+                # Ensure all default config keys are present within each channel's config (one dict merge)
+                channel_data["config"] = {**DEFAULT_CONFIG_CHANNEL_CONFIG, **channel_data.get("config", {})}
+                channel_data.setdefault("programs", [])
+                channel_data.setdefault("last_known_streaming_state", False) # New: for auto-start
+                channels[channel_name] = channel_data
             return channels
-        except json.JSONDecodeError:
+        except JSON_PARSE_ERRORS:
             print(f"Error reading {CHANNELS_FILE}. Creating with default channels.")
             return _initialize_default_channels(default_count)
     else:
@@ -173,8 +459,7 @@ def _initialize_default_channels(count):
             },
             "programs": []
         }
-    with open(CHANNELS_FILE, 'w') as f:
-        json.dump(channels, f, indent=4)
+    _write_json_atomic(CHANNELS_FILE, channels)
     return channels
 
 DEFAULT_CONFIG_CHANNEL_CONFIG = {
@@ -199,15 +484,98 @@ DEFAULT_CONFIG_CHANNEL_CONFIG = {
 def save_channels_config(channels):
     """Saves all channel configurations to channels.json."""
     try:
-        with open(CHANNELS_FILE, 'w') as f:
-            json.dump(channels, f, indent=4)
+        _write_json_atomic(CHANNELS_FILE, channels)
     except Exception as e:
         print(f"Error saving {CHANNELS_FILE}: {e}") # Use print as logger might not be ready
 
+@functools.lru_cache(maxsize=512)
+def _is_multicast_address(ip):
+    """True if ip is an IPv4 multicast address (224.0.0.0/4); False for unicast, IPv6 or unparsable input (listeners are AF_INET)."""
+    try:
+        return ipaddress.IPv4Address(ip).is_multicast
+    except ValueError:
+        return False
+
+@functools.lru_cache(maxsize=512)
+def _build_input_url(input_type, ip, port, url, srt_mode):
+    """Pure (memoized) builder for the FFmpeg input URL; the arguments are the only config fields it depends on."""
+    if input_type in ["HLS (M3U8)", "YouTube"]:
+        return url
+    elif input_type == "UDP":
+        return f"udp://@{ip}:{port}"
+    elif input_type == "SRT":
+        return f"srt://{ip}:{port}?mode={srt_mode}"
+    return ""
+
+@functools.lru_cache(maxsize=512)
+def _build_output_url(output_type, output_ip, output_port, output_url, srt_mode,
+                      srt_latency, srt_maxbw, srt_tsbpdmode, srt_sndbuf, srt_rcvbuf, rtp_protocol):
+    """Pure (memoized) builder for the FFmpeg output URL; the SRT query string is assembled only on a cache miss."""
+    if output_type == "UDP":
+        return f"udp://@{output_ip}:{output_port}"
+    elif output_type == "SRT":
+        ip = output_ip
+        if srt_mode == "listener" and not ip:
+            ip = "0.0.0.0" # Default to bind to all interfaces if listener and no IP specified
+        
+        srt_params = []
+        if srt_latency and srt_latency != "0":
+            srt_params.append(f"latency={srt_latency}")
+        if srt_maxbw and srt_maxbw != "0":
+            srt_params.append(f"maxbw={srt_maxbw}")
+        if srt_tsbpdmode in ["True", "False"]:
+            srt_params.append(f"tsbpdmode={srt_tsbpdmode.lower()}")
+        if srt_sndbuf and srt_sndbuf != "0":
+            srt_params.append(f"sndbuf={srt_sndbuf}")
+        if srt_rcvbuf and srt_rcvbuf != "0":
+            srt_params.append(f"rcvbuf={srt_rcvbuf}")
+
+        if srt_params:
+            params_string = f"?mode={srt_mode}&{'&'.join(srt_params)}"
+        else:
+            params_string = f"?mode={srt_mode}"
+
+        return f"srt://{ip}:{output_port}{params_string}"
+    elif output_type == "RTMP":
+        return output_url
+    elif output_type == "RTP":
+        return f"{rtp_protocol}://{output_ip}:{output_port}"
+    return ""
+
+@dataclass
+class ChannelView:
+    """Parsed, ready-to-use input settings of one channel; the port is validated once when the view is built."""
+    __slots__ = ("input_type", "input_ip", "input_port", "bind")
+    input_type: str
+    input_ip: str
+    input_port: int
+    bind: str # Local bind address, with "Auto" already resolved to 0.0.0.0
+
+    @classmethod
+    def from_config(cls, config):
+        """Builds a view from a channel config dict. Raises ValueError if the input port is not an integer."""
+        bind = config['local_bind_interface']
+        return cls(config['input_type'], config['input_ip'], int(config['input_port']),
+                   "0.0.0.0" if bind == "Auto" else bind)
+
+@dataclass
+class StderrWatch:
+    """Per-process state of the selector-driven FFmpeg stderr watch (POSIX; see _stderr_watch_thread)."""
+    __slots__ = ("channel_name", "proc", "deadline", "tail", "first_line")
+    channel_name: str
+    proc: subprocess.Popen
+    deadline: float # time.monotonic() at which the watch ends
+    tail: bytes # Incomplete last line from the previous read
+    first_line: bool # Whether the next complete line is FFmpeg's first
+
 class FFmpegStreamerApp:
     def __init__(self, master):
         self.master = master
         self.app_config = load_app_config()
+        # The app config is only read at startup, so derived values used on timers are computed once here
+        network_max_mbps = self.app_config.get("network_max_bandwidth_mbps", 100) # Default to 100 Mbps
+        self._net_max_inv = 100.0 / network_max_mbps if network_max_mbps > 0 else 0.0 # Mbps -> utilization %; 0 prevents division by zero
+        self._preview_auto_stop_ms = self.app_config['preview_auto_stop_seconds'] * 1000
         self.master.title("VigilSiddhi Encoder") # Kept user's custom title
         self.master.geometry("1200x800")
         ttkb.Style(theme=self.app_config["theme"])
@@ -236,23 +604,79 @@ class FFmpegStreamerApp:
 
         self.channels = load_channels_config(self.app_config["default_channels_count"])
         self.processes = {} # Stores {channel_name: subprocess.Popen object}
-        self.stderr_monitors = {} # Stores {channel_name: threading.Thread object for stderr monitoring}
+        self.stderr_monitors = {} # Stores {channel_name: stderr monitoring Thread (Windows) or StderrWatch (POSIX)}
         self.udp_listeners = {} # Stores {channel_name: socket object}
-        self.udp_packet_timestamps = {} # Stores {channel_name: last_packet_received_time} (for UDP listener)
-        self.udp_listener_threads = {} # Stores {channel_name: threading.Thread object for UDP listener}
-        self.udp_listener_active_flags = {} # Stores {channel_name: threading.Event} to signal UDP listener thread to stop
+        self.udp_packet_timestamps = {} # Stores {channel_name: last_packet_received_time (time.monotonic)} (for UDP listener)
+        self.udp_input_live = {} # Stores {channel_name: bool} - packets flowing since the last gap
+        self._channel_views = {} # Stores {channel_name: ChannelView}, rebuilt lazily after the channel's config is edited
+        self.udp_selector = selectors.DefaultSelector() # All UDP listener sockets, watched by one reactor thread
+        # Self-pipe that interrupts the reactor's blocking select() when listeners change or the app closes
+        self._udp_wakeup_r, self._udp_wakeup_w = socket.socketpair()
+        self._udp_wakeup_r.setblocking(False)
+        self._udp_wakeup_w.setblocking(False)
+        self.udp_selector.register(self._udp_wakeup_r, selectors.EVENT_READ, data=None) # data=None marks the wakeup socket
+        self._udp_reactor_stop = threading.Event()
         self.stream_stop_requested = {} # Stores {channel_name: boolean} to indicate if stop was user-initiated
+        self._active_udp_inputs = {} # Stores {(input_ip, input_port): channel_name} for running UDP-input streams
+        self._child_exits = collections.deque() # (channel_name, proc) pairs pushed by monitor_process threads
+        self._child_exit_cv = threading.Condition() # Notified after each push, wakes the process monitor
+        # POSIX: one thread watches every FFmpeg stderr pipe through a selector instead of a thread per stream.
+        # New watches are handed over through _stderr_pending, so only that thread touches the selector.
+        self._stderr_selector = None
+        if os.name != 'nt':
+            self._stderr_selector = selectors.DefaultSelector()
+            self._stderr_pending = collections.deque()
+            self._stderr_wakeup_r, self._stderr_wakeup_w = socket.socketpair()
+            self._stderr_wakeup_r.setblocking(False)
+            self._stderr_wakeup_w.setblocking(False)
+            self._stderr_selector.register(self._stderr_wakeup_r, selectors.EVENT_READ, data=None)
+            self._stderr_watch_stop = threading.Event()
+            self.stderr_watch_thread = threading.Thread(target=self._stderr_watch_thread)
+            self.stderr_watch_thread.daemon = True
+            self.stderr_watch_thread.start()
+        # Reused workers for terminate()/wait()/kill() on stopped streams, instead of a throwaway thread per stop
+        self._term_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="ffmpeg-term")
+        # Preview helpers (reaping stopped ffplay processes, Windows stderr readers) share their own workers.
+        # These tasks never call into Tk (the Tk thread polls their futures), so a worker can't block on a
+        # busy or finished mainloop and hold up interpreter exit.
+        self._preview_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="ffplay")
+        # The process monitor waits on one selector instead of a wait() thread per FFmpeg child. On Linux each
+        # child gets a pidfd that turns readable when it exits; on other POSIX systems SIGCHLD writes to the
+        # wakeup socketpair (signal.set_wakeup_fd). The socketpair also lets fallback monitor_process threads
+        # (Windows, or if pidfd_open fails for one child) wake that selector.
+        self._proc_selector = None
+        self._proc_monitor_stop = threading.Event() # Set by on_closing to end _monitor_ffmpeg_processes
+        self._sigchld_wakeup = False # True once SIGCHLD is wired to the wakeup socketpair
+        if PIDFD_SUPPORTED or SIGCHLD_WAKEUP_SUPPORTED:
+            self._proc_selector = selectors.DefaultSelector()
+            self._proc_wakeup_r, self._proc_wakeup_w = socket.socketpair()
+            self._proc_wakeup_r.setblocking(False)
+            self._proc_wakeup_w.setblocking(False)
+            self._proc_selector.register(self._proc_wakeup_r, selectors.EVENT_READ, data=None)
+            if SIGCHLD_WAKEUP_SUPPORTED:
+                # A Python-level handler must be installed for the C handler to write the wakeup byte.
+                # Children are still reaped per process (Popen.poll/wait), never with waitpid(-1), so
+                # subprocess.run callers (ffprobe, yt-dlp) keep their own return codes.
+                try:
+                    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+                    signal.set_wakeup_fd(self._proc_wakeup_w.fileno(), warn_on_full_buffer=False)
+                    self._sigchld_wakeup = True
+                except ValueError: # Not on the main thread; fall back to monitor_process threads
+                    self.logger.warning("Could not install the SIGCHLD wakeup; watching FFmpeg processes with wait threads.")
+        self._yt_url_cache = {} # Stores {youtube_page_url: (resolved_stream_url, expiry_monotonic)} from yt-dlp
         
         self.current_channel = None
 
-        self.local_ip_addresses = self._get_local_ip_addresses()
+        # Placeholder choices; the real interface list (psutil) is filled in once the window has painted
+        self.local_ip_addresses = self._get_local_ip_addresses(enumerate_interfaces=False)
 
         if not os.path.exists("logs"):
             os.makedirs("logs")
 
         # Preview process attributes (now for ffplay)
         self.ffplay_process = None
-        self.ffplay_stderr_monitor = None # New: To monitor ffplay's stderr
+        self.ffplay_stderr_monitor = None # New: To monitor ffplay's stderr (Windows; a _preview_pool future)
+        self.ffplay_stderr_poll_id = None # after() ID of the ffplay stderr poll (POSIX)
         self.preview_running = False
         self.preview_auto_stop_id = None # To store after job ID for auto-stop
         self.current_preview_type = None # Stores "input" or "output" or None
@@ -260,6 +684,30 @@ class FFmpegStreamerApp:
         # Advanced options visibility state
         self.advanced_options_visible = tk.BooleanVar(value=False) # Initially hidden
         self.advanced_options_button_text = tk.StringVar(value="Advanced") # For the toggle button text
+        self._display_name_after_id = None # Pending after() ID of the debounced display-name UI refresh
+        self._program_combo_values = () # Values last assigned to program_id_combo, to skip no-op reassignments
+        self._program_has_video = {} # {channel_name: {program_id (str): has video stream}}, rebuilt with the program list
+        # Status changes are pushed to the UI through _schedule_refresh instead of being polled
+        self._pending_refresh_id = None # after() ID of the coalesced UI refresh, None when none is queued
+        self._pending_status_recompute = False # Whether that refresh should first recompute all stream statuses
+        self._state_gen = 0 # Bumped on every refresh request or status flip (Tk thread only)
+        self._swept_gen = -1 # _state_gen as of the last full status sweep
+        self._next_stale_deadline = 0.0 # Earliest monotonic time a currently fresh UDP input could go stale
+        self._loading_config = False # True while load_channel_config fills the UI variables (write-traces ignore it)
+        self._grid_layouts = {} # Stores {group: {widget: grid options}} last applied by _apply_grid_layout
+        self._grid_removed = {} # Stores {widget: grid options} remembered by grid_remove() for hidden widgets
+        self._scroll_update_pending = False # True while an idle scroll region update is queued
+        self._app_config_save_after_id = None # Pending after() ID of the debounced config.json write
+        self._stateful_widgets = None # Cached config widgets toggled by update_ui_for_channel (see _get_stateful_widgets)
+        self._widget_states = {} # Stores {widget: state} last applied through _set_widgets_state
+        self._ui_state_key = None # (channel, is_streaming, input_type, output_type) last applied by update_ui_for_channel
+        # One worker writes config.json snapshots in order; on_closing drains it before the final synchronous save
+        self._app_config_save_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-save")
+
+        # Single reactor thread serving every UDP listener socket
+        self.udp_reactor_thread = threading.Thread(target=self._udp_reactor_thread)
+        self.udp_reactor_thread.daemon = True
+        self.udp_reactor_thread.start()
 
         # Initialize UDP listeners for all UDP channels on startup
         self.logger.info("Initializing UDP listeners for all configured UDP channels...")
@@ -267,12 +715,8 @@ class FFmpegStreamerApp:
             config = channel_data["config"]
             if config["input_type"] == "UDP":
                 try:
-                    udp_ip = config['input_ip']
-                    udp_port = int(config['input_port'])
-                    bind_address = config['local_bind_interface']
-                    if bind_address == "Auto":
-                        bind_address = "0.0.0.0"
-                    self._start_udp_listener(channel_name, udp_ip, udp_port, bind_address)
+                    view = self._get_channel_view(channel_name)
+                    self._start_udp_listener(channel_name, view.input_ip, view.input_port, view.bind)
                 except ValueError:
                     self.logger.error(f"[{channel_name}] Invalid UDP port '{config['input_port']}' for listener on startup. Setting status to unavailable.")
                     self._set_input_stream_status(channel_name, "unavailable")
@@ -290,11 +734,12 @@ class FFmpegStreamerApp:
         # Auto-start streams that were running at last shutdown
         # This needs to be done *after* initial status setting, but before mainloop
         self.logger.info("Checking for streams to auto-start from last session...")
-        for channel_name, channel_data in list(self.channels.items()):
-            if channel_data.get("last_known_streaming_state", False):
-                self.logger.info(f"Attempting to auto-start stream for '{channel_name}' based on last known state.")
-                # Use master.after to schedule the start, so it doesn't block UI during startup
-                self.master.after(100, self.start_stream_internal, channel_name)
+        channels_to_start = [name for name, data in self.channels.items() if data.get("last_known_streaming_state", False)]
+        for index, channel_name in enumerate(channels_to_start):
+            self.logger.info(f"Attempting to auto-start stream for '{channel_name}' based on last known state.")
+            # Use master.after to schedule the start, so it doesn't block UI during startup.
+            # Starts are staggered so N FFmpeg spawns don't all land on the same event-loop tick.
+            self.master.after(100 + index * AUTO_START_STAGGER_MS, self.start_stream_internal, channel_name)
 
         # Start the periodic FFmpeg process monitor thread (only checks if process is running)
         self.process_monitor_thread = threading.Thread(target=self._monitor_ffmpeg_processes)
@@ -313,7 +758,8 @@ class FFmpegStreamerApp:
 
         self.channel_list_frame = ttk.Frame(left_frame)
         self.channel_list_frame.pack(fill=BOTH, expand=True, pady=(0, 10)) # Added pady
-        self.channel_buttons = {}
+        self.channel_buttons = weakref.WeakValueDictionary() # {channel_name: Button}; entries vanish once a button is destroyed
+        self._button_cache = {} # Stores {channel_name: (display_name, btn_style)} last applied to the channel button
         
         self._populate_channel_list()
 
@@ -329,12 +775,7 @@ class FFmpegStreamerApp:
         # Bind the canvas's Configure event to resize the scrollable_frame's width
         self.canvas.bind("<Configure>", self._on_canvas_configure)
 
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(
-                scrollregion=self.canvas.bbox("all")
-            )
-        )
+        self.scrollable_frame.bind("<Configure>", lambda e: self._request_scroll_update())
 
         self.canvas_window_id = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=self.scrollbar.set)
@@ -353,20 +794,16 @@ class FFmpegStreamerApp:
         
         self.status_indicators_frame = ttk.Frame(status_frame)
         self.status_indicators_frame.pack(side=LEFT)
-        self.status_indicators = {}
-        self.status_tooltips = {} # Stores {channel_name: Tooltip object}
+        self.status_canvas = None # Single canvas holding one rectangle per channel
+        self._indicator_cache = {} # Stores {channel_name: (canvas_color, status_text)} last applied to the indicator
+        self.status_indicators = {} # Stores {channel_name: canvas rectangle item ID} (plain ints, owned by status_canvas)
+        self.status_tooltips = weakref.WeakValueDictionary() # Stores {channel_name: Tooltip object}; reclaimed with the canvas
         self.create_status_indicators()
 
         # --- System Resource Progress Bars ---
         self.system_meters_frame = ttk.Frame(top_bar_frame, style='TFrame')
         self.system_meters_frame.pack(side=LEFT, padx=10, anchor='w')
 
-        # Initialize psutil for network bytes
-        psutil.net_io_counters.cache_clear()
-        self.last_net_bytes_sent = psutil.net_io_counters().bytes_sent
-        self.last_net_bytes_recv = psutil.net_io_counters().bytes_recv
-        self.last_net_time = time.time()
-
         # CPU Progress Bar
         cpu_pb_frame = ttk.Frame(self.system_meters_frame)
         cpu_pb_frame.pack(side=LEFT, padx=5, pady=2)
@@ -390,6 +827,7 @@ class FFmpegStreamerApp:
         self.network_pb.pack(side=TOP)
         self.network_pb_label = ttk.Label(network_pb_frame, text="NW", font=("Helvetica", 9, "bold"))
         self.network_pb_label.pack(side=BOTTOM)
+        self._meter_state = {} # Stores {meter_name: (value, text, bootstyle)} last applied to each system meter
 
 
         self.logo_label = ttk.Label(top_bar_frame)
@@ -425,16 +863,46 @@ class FFmpegStreamerApp:
 
         # Schedule periodic UI updates (for system metrics and indicator colors)
         self._schedule_ui_update()
-        self._update_system_metrics() # Start system metrics update loop
+        # Start system metrics sampling; psutil runs on its own thread and only the widget updates happen here
+        metrics_thread = threading.Thread(target=self._system_metrics_worker)
+        metrics_thread.daemon = True
+        metrics_thread.start()
+        self.master.after_idle(self._load_local_interfaces) # Runs after the first paint's idle redraws
 
 
     def _schedule_ui_update(self):
-        """Schedules a periodic update of the UI status indicators."""
-        self._refresh_all_stream_statuses() # Call refresh here
-        # The update_status_indicators and update_ui_for_channel calls are now inside _set_input_stream_status
-        # which is called by _refresh_all_stream_statuses if a change occurs.
-        # This prevents redundant calls and ensures consistency.
-        self.master.after(1000, self._schedule_ui_update) # Update every 1 second
+        """
+        Schedules the periodic UDP staleness sweep.
+        Indicator redraws are driven by status changes (see _schedule_refresh); this tick only exists because
+        a stopped UDP feed produces no packets (and therefore no event) by itself.
+        """
+        # Skip the sweep when nothing was reported since the last one and no UDP input can have gone stale yet
+        if self._state_gen != self._swept_gen or time.monotonic() >= self._next_stale_deadline:
+            self._refresh_all_stream_statuses()
+        sweep_interval_ms = int(max(1, self.app_config["udp_packet_timeout_seconds"] / 2) * 1000)
+        self.master.after(sweep_interval_ms, self._schedule_ui_update)
+
+    def _schedule_refresh(self, recompute_statuses=False):
+        """
+        Requests a redraw of the indicators, buttons and config widgets (optionally after recomputing all statuses).
+        Requests arriving within UI_REFRESH_COALESCE_MS are merged into one _run_refresh. Tk thread only;
+        worker threads go through self.master.after(0, self._schedule_refresh, ...).
+        """
+        self._state_gen += 1
+        if recompute_statuses:
+            self._pending_status_recompute = True
+        if self._pending_refresh_id is None:
+            self._pending_refresh_id = self.master.after(UI_REFRESH_COALESCE_MS, self._run_refresh)
+
+    def _run_refresh(self):
+        """Performs the coalesced refresh scheduled by _schedule_refresh."""
+        if self._pending_status_recompute:
+            self._pending_status_recompute = False
+            # Still marked pending here, so status flips during the recompute fold into this same redraw
+            self._refresh_all_stream_statuses()
+        self._pending_refresh_id = None
+        self.update_status_indicators()
+        self.update_ui_for_channel()
 
     def _setup_logging(self):
         """Sets up the application's logging system with timed rotating files."""
@@ -442,6 +910,8 @@ class FFmpegStreamerApp:
         # Set the logger's level based on config
         self.logger.setLevel(self.app_config["logging_level"])
 
+        self.log_listener = None # Background QueueListener that owns the console/file handlers
+
         # Prevent duplicate handlers if called multiple times
         if not self.logger.handlers:
             # Create logs directory if it doesn't exist
@@ -455,7 +925,6 @@ class FFmpegStreamerApp:
             console_handler.setLevel(self.app_config["logging_level"]) 
             console_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
             console_handler.setFormatter(console_formatter)
-            self.logger.addHandler(console_handler)
 
             # File handler for daily log rotation
             file_handler = TimedRotatingFileHandler(
@@ -468,7 +937,12 @@ class FFmpegStreamerApp:
             file_handler.setLevel(self.app_config["logging_level"]) # Ensure file logs at configured level
             file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
             file_handler.setFormatter(file_formatter)
-            self.logger.addHandler(file_handler)
+
+            # Log calls only enqueue the record; the listener thread does the actual stream/file I/O
+            log_queue = queue.Queue(-1)
+            self.logger.addHandler(QueueHandler(log_queue))
+            self.log_listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+            self.log_listener.start()
 
         self.logger.info("Application logging initialized.")
 
@@ -480,29 +954,36 @@ class FFmpegStreamerApp:
                              command=lambda name=channel_name: self.select_channel(name), style='outline-secondary.TButton', padding=10)
             btn.pack(fill=X, pady=4) # Increased pady
             self.channel_buttons[channel_name] = btn
+            self._button_cache.pop(channel_name, None) # New button; apply its state on the next update
 
-    def _get_local_ip_addresses(self):
+    def _get_local_ip_addresses(self, enumerate_interfaces=True):
         """
         Discovers and returns a list of local IP addresses available on the machine.
         Includes 'Auto' (for 0.0.0.0 binding) and '127.0.0.1' (localhost).
+        Reads the interface table directly (no hostname/DNS lookup), so it cannot stall on a bad resolver.
+        With enumerate_interfaces=False only those two fixed choices are returned, without touching psutil.
         """
-        ips = ["Auto"]
+        ips = {"Auto", "127.0.0.1"}
+        if not enumerate_interfaces:
+            return sorted(ips)
         try:
-            hostname = socket.gethostname()
-            ip_list = socket.gethostbyname_ex(hostname)[2]
-            for ip in ip_list:
-                if ip not in ips:
-                    ips.append(ip)
-        except socket.gaierror:
-            self.logger.warning("Could not resolve local hostname to IP addresses.")
+            for nic, addrs in _psutil().net_if_addrs().items():
+                ips.update(addr.address for addr in addrs if addr.family == socket.AF_INET)
         except Exception as e:
             self.logger.error(f"Error getting local IP addresses: {e}")
 
-        if "127.0.0.1" not in ips:
-            ips.append("127.0.0.1")
-
         return sorted(ips)
 
+    def _load_local_interfaces(self):
+        """Enumerates local IPv4 addresses and sets them as the Local Bind Interface choices."""
+        self.local_ip_addresses = self._get_local_ip_addresses()
+        self.local_bind_interface_combo['values'] = self.local_ip_addresses
+
+    def rescan_local_interfaces(self):
+        """Re-enumerates local IPv4 addresses and refreshes the Local Bind Interface choices."""
+        self._load_local_interfaces()
+        self.logger.info(f"Local interfaces rescanned: {', '.join(self.local_ip_addresses)}")
+
     def create_status_indicators(self):
         """
         Creates or re-creates the small colored canvas indicators in the top bar.
@@ -512,22 +993,34 @@ class FFmpegStreamerApp:
             widget.destroy()
         self.status_indicators.clear()
         self.status_tooltips.clear()
+        self._indicator_cache.clear() # New canvas items start unpainted
         
-        for channel_name in self.channels.keys():
-            canvas = tk.Canvas(self.status_indicators_frame, width=20, height=20, bg='grey', highlightthickness=0, relief=tk.RIDGE, bd=1) # Added relief and bd
-            canvas.pack(side=LEFT, padx=5) # Increased padx
-            self.status_indicators[channel_name] = canvas
+        # One canvas for all indicators: each channel is a rectangle item, recolored with itemconfig
+        spacing = STATUS_INDICATOR_SIZE + 10
+        self.status_canvas = tk.Canvas(self.status_indicators_frame, width=len(self.channels) * spacing, height=STATUS_INDICATOR_SIZE + 2, highlightthickness=0)
+        self.status_canvas.pack(side=LEFT)
+        for index, channel_name in enumerate(self.channels.keys()):
+            x0 = 5 + index * spacing
+            item_id = self.status_canvas.create_rectangle(x0, 1, x0 + STATUS_INDICATOR_SIZE, STATUS_INDICATOR_SIZE + 1, fill='grey', outline='black')
+            self.status_indicators[channel_name] = item_id
             # Create a tooltip for each indicator
-            self.status_tooltips[channel_name] = CustomTooltip(canvas, text="") # Changed to CustomTooltip
+            self.status_tooltips[channel_name] = CustomTooltip(self.status_canvas, text="", item=item_id) # Changed to CustomTooltip
 
     def load_logo(self):
         """Loads 'logo.png' and displays it in the top right corner with user-specified size."""
         try:
             logo_path = "logo.png" # Kept user's custom logo path
+            logo_size = (175, 75) # Kept user's custom logo size
             if os.path.exists(logo_path):
-                img = Image.open(logo_path)
-                img.thumbnail((175, 75), Image.Resampling.LANCZOS) # Kept user's custom logo size
-                self.logo_photo = ImageTk.PhotoImage(img)
+                cache_key = (logo_path, os.path.getmtime(logo_path), logo_size)
+                photo = _LOGO_CACHE.get(cache_key)
+                if photo is None:
+                    # Resample only when the file (or requested size) actually changed
+                    img = Image.open(logo_path)
+                    img.thumbnail(logo_size, Image.Resampling.LANCZOS)
+                    photo = ImageTk.PhotoImage(img)
+                    _LOGO_CACHE[cache_key] = photo
+                self.logo_photo = photo # Keep a strong reference so Tk doesn't drop the image
                 self.logo_label.config(image=self.logo_photo)
         except Exception as e:
             self.logger.error(f"Error loading logo: {e}")
@@ -579,6 +1072,8 @@ class FFmpegStreamerApp:
         self.local_bind_interface_var = tk.StringVar(value="Auto")
         self.local_bind_interface_combo = ttk.Combobox(self.local_bind_interface_frame, textvariable=self.local_bind_interface_var, values=self.local_ip_addresses, state='readonly', width=20)
         self.local_bind_interface_combo.grid(row=0, column=1, padx=5, pady=2, sticky='we')
+        self.rescan_interfaces_button = ttk.Button(self.local_bind_interface_frame, text="Rescan Interfaces", command=self.rescan_local_interfaces, style='secondary.TButton')
+        self.rescan_interfaces_button.grid(row=0, column=2, padx=5, pady=2, sticky=W)
 
         self.scan_button = ttk.Button(self.input_group, text="Scan for Services", command=self.scan_services, style='info.TButton') # Added style
         
@@ -646,59 +1141,19 @@ class FFmpegStreamerApp:
                                                          style='secondary.TButton')
 
         # --- Advanced Stream Options Group ---
-        self.advanced_options_group = ttk.LabelFrame(self.config_frame, text="Advanced Stream Options", padding="15", bootstyle="info") # Increased padding, added bootstyle
-        self.advanced_options_group.columnconfigure(1, weight=1)
-        self.advanced_options_group.pack_forget() # Ensure it's hidden and takes no space initially
-        
-        ttk.Label(self.advanced_options_group, text="Input Probesize:").grid(row=0, column=0, padx=5, pady=2, sticky=W)
+        # Only the variables are created here, so load/save work on them at any time; the widgets are built
+        # by _build_advanced_options_group the first time the user reveals the group.
+        self.advanced_options_group = None
         self.input_probesize_var = tk.StringVar()
-        ttk.Entry(self.advanced_options_group, textvariable=self.input_probesize_var, width=15).grid(row=0, column=1, padx=5, pady=2, sticky=W)
-        ttk.Label(self.advanced_options_group, text="(e.g., 10M)").grid(row=0, column=2, padx=2, pady=2, sticky=W)
-
-        ttk.Label(self.advanced_options_group, text="Input Analyzeduration:").grid(row=1, column=0, padx=5, pady=2, sticky=W)
         self.input_analyzeduration_var = tk.StringVar()
-        ttk.Entry(self.advanced_options_group, textvariable=self.input_analyzeduration_var, width=15).grid(row=1, column=1, padx=5, pady=2, sticky=W)
-        ttk.Label(self.advanced_options_group, text="(e.g., 10M)").grid(row=1, column=2, padx=2, pady=2, sticky=W)
-
-        ttk.Label(self.advanced_options_group, text="Output Max Delay (us):").grid(row=2, column=0, padx=5, pady=2, sticky=W)
         self.output_max_delay_var = tk.StringVar()
-        ttk.Entry(self.advanced_options_group, textvariable=self.output_max_delay_var, width=15).grid(row=2, column=1, padx=5, pady=2, sticky=W)
-        ttk.Label(self.advanced_options_group, text="(0 for default)").grid(row=2, column=2, padx=2, pady=2, sticky=W)
-
-        self.srt_output_options_frame = ttk.Frame(self.advanced_options_group)
-        self.srt_output_options_frame.columnconfigure(1, weight=1)
-        
-        ttk.Label(self.srt_output_options_frame, text="SRT Latency (ms):").grid(row=0, column=0, padx=5, pady=2, sticky=W)
         self.output_srt_latency_var = tk.StringVar()
-        ttk.Entry(self.srt_output_options_frame, textvariable=self.output_srt_latency_var, width=10).grid(row=0, column=1, padx=5, pady=2, sticky=W)
-
-        ttk.Label(self.srt_output_options_frame, text="SRT Max Bandwidth (pkts/s):").grid(row=1, column=0, padx=5, pady=2, sticky=W)
         self.output_srt_maxbw_var = tk.StringVar()
-        ttk.Entry(self.srt_output_options_frame, textvariable=self.output_srt_maxbw_var, width=10).grid(row=1, column=1, padx=5, pady=2, sticky=W)
-        ttk.Label(self.srt_output_options_frame, text="(0 for unlimited)").grid(row=1, column=2, padx=2, pady=2, sticky=W)
-
-        ttk.Label(self.srt_output_options_frame, text="SRT TSBPD Mode:").grid(row=2, column=0, padx=5, pady=2, sticky=W)
         self.output_srt_tsbpdmode_var = tk.StringVar(value="True")
-        ttk.Combobox(self.srt_output_options_frame, textvariable=self.output_srt_tsbpdmode_var, values=["True", "False"], state='readonly', width=10).grid(row=2, column=1, padx=5, pady=2, sticky=W)
-
-        ttk.Label(self.srt_output_options_frame, text="SRT Send Buffer (bytes):").grid(row=3, column=0, padx=5, pady=2, sticky=W)
         self.output_srt_sndbuf_var = tk.StringVar()
-        ttk.Entry(self.srt_output_options_frame, textvariable=self.output_srt_sndbuf_var, width=10).grid(row=3, column=1, padx=5, pady=2, sticky=W)
-        ttk.Label(self.srt_output_options_frame, text="(0 for default)").grid(row=3, column=2, padx=2, pady=2, sticky=W)
-
-        ttk.Label(self.srt_output_options_frame, text="SRT Receive Buffer (bytes):").grid(row=4, column=0, padx=5, pady=2, sticky=W)
         self.output_srt_rcvbuf_var = tk.StringVar()
-        ttk.Entry(self.srt_output_options_frame, textvariable=self.output_srt_rcvbuf_var, width=10).grid(row=4, column=1, padx=5, pady=2, sticky=W)
-        ttk.Label(self.srt_output_options_frame, text="(0 for default)").grid(row=4, column=2, padx=2, pady=2, sticky=W)
-
-        self.udp_output_options_frame = ttk.Frame(self.advanced_options_group)
-        self.udp_output_options_frame.columnconfigure(1, weight=1)
-
-        ttk.Label(self.udp_output_options_frame, text="UDP Packet Size:").grid(row=0, column=0, padx=5, pady=2, sticky=W)
         self.output_udp_pkt_size_var = tk.StringVar()
-        ttk.Entry(self.udp_output_options_frame, textvariable=self.output_udp_pkt_size_var, width=10).grid(row=0, column=1, padx=5, pady=2, sticky=W)
-        ttk.Label(self.udp_output_options_frame, text="(e.g., 1316 for TS)").grid(row=0, column=2, padx=2, pady=2, sticky=W)
-        
+
         # --- Combined Action Buttons Frame ---
         self.action_buttons_frame = ttk.Frame(self.config_tab, padding="15") # Increased padding
         self.action_buttons_frame.pack(side=BOTTOM, fill=X, pady=10)
@@ -724,6 +1179,7 @@ class FFmpegStreamerApp:
 
         self.preview_output_button = ttk.Button(self.action_buttons_frame, text="Preview Output", command=lambda: self.toggle_preview("output"), style='secondary.TButton')
         self.preview_output_button.grid(row=0, column=5, padx=5, pady=5)
+        self._preview_btn_state = {"input": None, "output": None} # Last (state, text, style) applied to each preview button
 
         self.start_button = ttk.Button(self.action_buttons_frame, text="Start Stream", command=self.start_stream, style='success.TButton') # Changed to success
         self.start_button.grid(row=0, column=6, padx=5, pady=5)
@@ -733,6 +1189,53 @@ class FFmpegStreamerApp:
         self.on_input_type_change()
         self.on_output_type_change()
 
+    def _build_advanced_options_group(self):
+        """Creates the Advanced Stream Options group and its SRT/UDP option frames on first reveal."""
+        self.advanced_options_group = ttk.LabelFrame(self.config_frame, text="Advanced Stream Options", padding="15", bootstyle="info") # Increased padding, added bootstyle
+        self.advanced_options_group.columnconfigure(1, weight=1)
+        self._stateful_widgets = None # New config widgets; re-collect on next update_ui_for_channel
+        self._ui_state_key = None # ...and apply the current state to them
+        
+        ttk.Label(self.advanced_options_group, text="Input Probesize:").grid(row=0, column=0, padx=5, pady=2, sticky=W)
+        ttk.Entry(self.advanced_options_group, textvariable=self.input_probesize_var, width=15).grid(row=0, column=1, padx=5, pady=2, sticky=W)
+        ttk.Label(self.advanced_options_group, text="(e.g., 10M)").grid(row=0, column=2, padx=2, pady=2, sticky=W)
+
+        ttk.Label(self.advanced_options_group, text="Input Analyzeduration:").grid(row=1, column=0, padx=5, pady=2, sticky=W)
+        ttk.Entry(self.advanced_options_group, textvariable=self.input_analyzeduration_var, width=15).grid(row=1, column=1, padx=5, pady=2, sticky=W)
+        ttk.Label(self.advanced_options_group, text="(e.g., 10M)").grid(row=1, column=2, padx=2, pady=2, sticky=W)
+
+        ttk.Label(self.advanced_options_group, text="Output Max Delay (us):").grid(row=2, column=0, padx=5, pady=2, sticky=W)
+        ttk.Entry(self.advanced_options_group, textvariable=self.output_max_delay_var, width=15).grid(row=2, column=1, padx=5, pady=2, sticky=W)
+        ttk.Label(self.advanced_options_group, text="(0 for default)").grid(row=2, column=2, padx=2, pady=2, sticky=W)
+
+        self.srt_output_options_frame = ttk.Frame(self.advanced_options_group)
+        self.srt_output_options_frame.columnconfigure(1, weight=1)
+        
+        ttk.Label(self.srt_output_options_frame, text="SRT Latency (ms):").grid(row=0, column=0, padx=5, pady=2, sticky=W)
+        ttk.Entry(self.srt_output_options_frame, textvariable=self.output_srt_latency_var, width=10).grid(row=0, column=1, padx=5, pady=2, sticky=W)
+
+        ttk.Label(self.srt_output_options_frame, text="SRT Max Bandwidth (pkts/s):").grid(row=1, column=0, padx=5, pady=2, sticky=W)
+        ttk.Entry(self.srt_output_options_frame, textvariable=self.output_srt_maxbw_var, width=10).grid(row=1, column=1, padx=5, pady=2, sticky=W)
+        ttk.Label(self.srt_output_options_frame, text="(0 for unlimited)").grid(row=1, column=2, padx=2, pady=2, sticky=W)
+
+        ttk.Label(self.srt_output_options_frame, text="SRT TSBPD Mode:").grid(row=2, column=0, padx=5, pady=2, sticky=W)
+        ttk.Combobox(self.srt_output_options_frame, textvariable=self.output_srt_tsbpdmode_var, values=["True", "False"], state='readonly', width=10).grid(row=2, column=1, padx=5, pady=2, sticky=W)
+
+        ttk.Label(self.srt_output_options_frame, text="SRT Send Buffer (bytes):").grid(row=3, column=0, padx=5, pady=2, sticky=W)
+        ttk.Entry(self.srt_output_options_frame, textvariable=self.output_srt_sndbuf_var, width=10).grid(row=3, column=1, padx=5, pady=2, sticky=W)
+        ttk.Label(self.srt_output_options_frame, text="(0 for default)").grid(row=3, column=2, padx=2, pady=2, sticky=W)
+
+        ttk.Label(self.srt_output_options_frame, text="SRT Receive Buffer (bytes):").grid(row=4, column=0, padx=5, pady=2, sticky=W)
+        ttk.Entry(self.srt_output_options_frame, textvariable=self.output_srt_rcvbuf_var, width=10).grid(row=4, column=1, padx=5, pady=2, sticky=W)
+        ttk.Label(self.srt_output_options_frame, text="(0 for default)").grid(row=4, column=2, padx=2, pady=2, sticky=W)
+
+        self.udp_output_options_frame = ttk.Frame(self.advanced_options_group)
+        self.udp_output_options_frame.columnconfigure(1, weight=1)
+
+        ttk.Label(self.udp_output_options_frame, text="UDP Packet Size:").grid(row=0, column=0, padx=5, pady=2, sticky=W)
+        ttk.Entry(self.udp_output_options_frame, textvariable=self.output_udp_pkt_size_var, width=10).grid(row=0, column=1, padx=5, pady=2, sticky=W)
+        ttk.Label(self.udp_output_options_frame, text="(e.g., 1316 for TS)").grid(row=0, column=2, padx=2, pady=2, sticky=W)
+
     def toggle_advanced_options(self):
         """Toggles the visibility of the advanced options group and adjusts button text."""
         if self.advanced_options_visible.get():
@@ -740,13 +1243,16 @@ class FFmpegStreamerApp:
             self.advanced_options_visible.set(False)
             self.advanced_options_button_text.set("Advanced")
         else:
+            if self.advanced_options_group is None:
+                self._build_advanced_options_group()
+                self.update_ui_for_channel() # Disable the new widgets if the channel is streaming
             self.advanced_options_group.pack(fill=X, pady=10) # Use pack to occupy space, increased pady
             self.advanced_options_visible.set(True)
-            self.on_output_type_change() # This will grid the specific SRT/UDP frames within advanced_options_group
-            self.advanced_options_button_text.set("Hide Advanced") # Set after on_output_type_change
+            self._apply_advanced_subframe_visibility(self.output_type_var.get()) # Grid the specific SRT/UDP frames within advanced_options_group
+            self.advanced_options_button_text.set("Hide Advanced")
         
         # Update scroll region after toggling visibility
-        self.master.after_idle(self._update_scroll_region)
+        self._request_scroll_update()
 
     def _on_canvas_configure(self, event):
         """Resizes the scrollable frame to match the canvas width and updates scroll region."""
@@ -756,12 +1262,20 @@ class FFmpegStreamerApp:
         # This is crucial for horizontal expansion
         self.canvas.itemconfig(self.canvas_window_id, width=canvas_width)
         # Update the scroll region to reflect the new size of the scrollable frame
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._request_scroll_update()
+
 
+    def _request_scroll_update(self):
+        """Schedules one idle-time scroll region update, coalescing any further requests until it runs."""
+        if not self._scroll_update_pending:
+            self._scroll_update_pending = True
+            self.master.after_idle(self._update_scroll_region)
 
     def _update_scroll_region(self):
         """Updates the scroll region of the canvas to fit its content."""
-        self.canvas.update_idletasks() # Ensure all widgets are rendered
+        # No update_idletasks() here: this runs from the idle queue, and any later resize of the
+        # scrollable frame fires its <Configure> binding, which requests another update.
+        self._scroll_update_pending = False
         self.canvas.config(scrollregion=self.canvas.bbox("all"))
 
     def manual_refresh_status(self):
@@ -773,110 +1287,136 @@ class FFmpegStreamerApp:
         # This prevents redundant calls and ensures consistency.
 
     def _on_display_name_change(self, *args):
-        """Updates the channel button text and internal data when the display name entry changes."""
-        if self.current_channel:
-            new_display_name = self.display_name_var.get()
-            if self.current_channel in self.channel_buttons:
-                self.channel_buttons[self.current_channel].config(text=new_display_name)
-            self.channels[self.current_channel]["display_name"] = new_display_name
-            self.update_status_indicators() # This will update the button text and color
+        """
+        Updates the internal display name when the entry changes and schedules a debounced UI refresh,
+        so a burst of keystrokes results in a single button/indicator pass.
+        """
+        if self.current_channel and not self._loading_config:
+            self.channels[self.current_channel]["display_name"] = self.display_name_var.get()
+            if self._display_name_after_id is not None:
+                self.master.after_cancel(self._display_name_after_id)
+            self._display_name_after_id = self.master.after(DISPLAY_NAME_DEBOUNCE_MS, self._flush_display_name_change)
+
+    def _flush_display_name_change(self):
+        """Applies the latest display names to the channel buttons and refreshes the status indicators."""
+        self._display_name_after_id = None
+        self.update_status_indicators() # Relabels only the buttons whose display name changed
+
+    def _apply_grid_layout(self, group, layout):
+        """
+        Diffs a desired {widget: grid options} layout against the one last applied for this group.
+        Only widgets that disappear are hidden and only new or moved widgets are re-gridded,
+        so redundant calls cause no geometry work. Returns True if anything changed.
+        Hidden widgets use grid_remove(), which keeps their grid options, so one that comes back
+        in the same slot is re-shown with a bare grid() instead of re-specifying every option.
+        """
+        previous = self._grid_layouts.get(group, {})
+        changed = False
+        for widget, options in previous.items():
+            if widget not in layout:
+                widget.grid_remove()
+                self._grid_removed[widget] = options
+                changed = True
+        for widget, options in layout.items():
+            if previous.get(widget) != options:
+                if self._grid_removed.pop(widget, None) == options:
+                    widget.grid() # Restore the remembered slot
+                else:
+                    widget.grid(**options)
+                changed = True
+        self._grid_layouts[group] = layout
+        return changed
 
     def on_input_type_change(self, event=None):
         """Adjusts visibility of input fields (IP/Port vs. URL) and new SRT/Interface options based on selected input type."""
         input_type = self.input_type_var.get()
-        
-        # Hide all dynamic input-specific frames and buttons first
-        self.input_url_frame.grid_forget()
-        self.input_ip_port_frame.grid_forget()
-        self.srt_mode_frame.grid_forget()
-        self.local_bind_interface_frame.grid_forget()
-        self.scan_button.grid_forget() # Hide scan button initially
 
         # Always ensure program_id_combo is in the correct state
         if input_type == "UDP":
-            self.program_id_combo.config(state='readonly')
+            self._set_widgets_state((self.program_id_combo,), 'readonly')
             if self.program_id_var.get() == "N/A for SRT" or self.program_id_var.get() == "N/A for this input type":
                 self.program_id_var.set("Scan input to populate")
         else:
-            self.program_id_combo.config(state='disabled')
+            self._set_widgets_state((self.program_id_combo,), 'disabled')
             self.program_id_var.set("N/A for this input type")
 
-        # Place input type specific widgets
+        # Collect input type specific widgets; anything not listed is hidden
+        layout = {}
         if input_type in ["UDP", "SRT"]:
-            self.input_ip_port_frame.grid(row=2, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Row 2 for IP/Port
-            self.local_bind_interface_frame.grid(row=4, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Row 4 for Local Bind
+            layout[self.input_ip_port_frame] = dict(row=2, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Row 2 for IP/Port
+            layout[self.local_bind_interface_frame] = dict(row=4, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Row 4 for Local Bind
             
             if input_type == "SRT":
-                self.srt_mode_frame.grid(row=5, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Row 5 for SRT Mode
-                self.scan_button.config(state='disabled')
+                layout[self.srt_mode_frame] = dict(row=5, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Row 5 for SRT Mode
+                self._set_widgets_state((self.scan_button,), 'disabled')
             else: # UDP
-                self.scan_button.config(state='normal')
-                self.scan_button.grid(row=3, column=2, padx=5, pady=5, sticky=E) # Scan button at Row 3, Col 2
+                self._set_widgets_state((self.scan_button,), 'normal')
+                layout[self.scan_button] = dict(row=3, column=2, padx=5, pady=5, sticky=E) # Scan button at Row 3, Col 2
         else: # HLS, YouTube
-            self.input_url_frame.grid(row=2, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Row 2 for URL
+            layout[self.input_url_frame] = dict(row=2, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Row 2 for URL
         
-        self.master.after_idle(self._update_scroll_region)
-
+        if self._apply_grid_layout("input", layout):
+            self._request_scroll_update()
+
+
+    def _apply_advanced_subframe_visibility(self, output_type):
+        """Grids the SRT or UDP sub-frame inside the advanced options group to match output_type."""
+        # Advanced output options frames live within the advanced_options_group and are
+        # only shown if that group itself is visible (they only exist once it has been built)
+        layout = {}
+        if self.advanced_options_visible.get() and self.advanced_options_group is not None:
+            if output_type == "UDP":
+                layout[self.udp_output_options_frame] = dict(row=5, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Grid within advanced_options_group
+            elif output_type == "SRT":
+                layout[self.srt_output_options_frame] = dict(row=3, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Grid within advanced_options_group
+        return self._apply_grid_layout("advanced", layout)
 
     def on_output_type_change(self, event=None):
         """Adjusts visibility of output fields based on selected output type."""
         output_type = self.output_type_var.get()
+        advanced_changed = self._apply_advanced_subframe_visibility(output_type)
 
-        # Hide all output-specific frames first
-        self.output_ip_port_frame.grid_forget()
-        self.output_url_frame.grid_forget()
-        self.output_srt_mode_frame.grid_forget()
-        self.output_rtp_protocol_frame.grid_forget()
-        self.output_rtp_payload_type_frame.grid_forget()
-        
-        # Hide advanced output options frames within the advanced_options_group
-        # These are only visible if advanced_options_group itself is visible
-        self.srt_output_options_frame.grid_forget() 
-        self.udp_output_options_frame.grid_forget() 
-
+        # Collect output-specific widgets; anything not listed is hidden
+        layout = {}
 
         # Determine the current row for dynamically placed elements within output_group
         current_row_for_dynamic_elements = 1 # Starts after "Output Type" (row 0)
 
         # Show relevant frames based on selection and update current_row_for_dynamic_elements
         if output_type == "UDP":
-            self.output_ip_port_frame.grid(row=current_row_for_dynamic_elements, column=0, columnspan=4, padx=5, pady=2, sticky='we') # Use columnspan=4 for consistency
+            layout[self.output_ip_port_frame] = dict(row=current_row_for_dynamic_elements, column=0, columnspan=4, padx=5, pady=2, sticky='we') # Use columnspan=4 for consistency
             current_row_for_dynamic_elements += 1
-            self.video_bitrate_entry.config(state='normal')
-            if self.advanced_options_visible.get(): # Only show if advanced options are globally visible
-                self.udp_output_options_frame.grid(row=5, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Grid within advanced_options_group
         elif output_type == "SRT":
-            self.output_ip_port_frame.grid(row=current_row_for_dynamic_elements, column=0, columnspan=4, padx=5, pady=2, sticky='we')
+            layout[self.output_ip_port_frame] = dict(row=current_row_for_dynamic_elements, column=0, columnspan=4, padx=5, pady=2, sticky='we')
             current_row_for_dynamic_elements += 1
-            self.output_srt_mode_frame.grid(row=current_row_for_dynamic_elements, column=0, columnspan=2, padx=5, pady=2, sticky='we')
+            layout[self.output_srt_mode_frame] = dict(row=current_row_for_dynamic_elements, column=0, columnspan=2, padx=5, pady=2, sticky='we')
             current_row_for_dynamic_elements += 1
-            self.video_bitrate_entry.config(state='normal')
-            if self.advanced_options_visible.get(): # Only show if advanced options are globally visible
-                self.srt_output_options_frame.grid(row=3, column=0, columnspan=3, padx=5, pady=2, sticky='we') # Grid within advanced_options_group
         elif output_type == "RTMP":
-            self.output_url_frame.grid(row=current_row_for_dynamic_elements, column=0, columnspan=2, padx=5, pady=2, sticky='we')
+            layout[self.output_url_frame] = dict(row=current_row_for_dynamic_elements, column=0, columnspan=2, padx=5, pady=2, sticky='we')
             current_row_for_dynamic_elements += 1
-            self.video_bitrate_entry.config(state='normal')
         elif output_type == "RTP":
-            self.output_ip_port_frame.grid(row=current_row_for_dynamic_elements, column=0, columnspan=4, padx=5, pady=2, sticky='we')
+            layout[self.output_ip_port_frame] = dict(row=current_row_for_dynamic_elements, column=0, columnspan=4, padx=5, pady=2, sticky='we')
             current_row_for_dynamic_elements += 1
-            self.output_rtp_protocol_frame.grid(row=current_row_for_dynamic_elements, column=0, columnspan=2, padx=5, pady=2, sticky=W)
+            layout[self.output_rtp_protocol_frame] = dict(row=current_row_for_dynamic_elements, column=0, columnspan=2, padx=5, pady=2, sticky=W)
             current_row_for_dynamic_elements += 1
-            self.output_rtp_payload_type_frame.grid(row=current_row_for_dynamic_elements, column=0, columnspan=2, padx=5, pady=2, sticky=W)
+            layout[self.output_rtp_payload_type_frame] = dict(row=current_row_for_dynamic_elements, column=0, columnspan=2, padx=5, pady=2, sticky=W)
             current_row_for_dynamic_elements += 1
-            self.video_bitrate_entry.config(state='normal')
+        self._set_widgets_state((self.video_bitrate_entry,), 'normal')
 
         # Place the Video Bitrate Label and Entry
-        self.video_bitrate_label.grid(row=current_row_for_dynamic_elements, column=0, padx=5, pady=5, sticky=W)
-        self.video_bitrate_entry.grid(row=current_row_for_dynamic_elements, column=1, padx=5, pady=5, sticky=W)
+        layout[self.video_bitrate_label] = dict(row=current_row_for_dynamic_elements, column=0, padx=5, pady=5, sticky=W)
+        layout[self.video_bitrate_entry] = dict(row=current_row_for_dynamic_elements, column=1, padx=5, pady=5, sticky=W)
         current_row_for_dynamic_elements += 1
 
         # Place the Advanced Options Toggle Button at the bottom right of the output_group
-        self.toggle_advanced_options_button.grid(row=current_row_for_dynamic_elements, column=1, padx=5, pady=5, sticky=SE)
-        self.toggle_advanced_options_button.master.columnconfigure(1, weight=1)
-        self.toggle_advanced_options_button.master.grid_rowconfigure(current_row_for_dynamic_elements, weight=1)
-        
-        self.master.after_idle(self._update_scroll_region)
+        layout[self.toggle_advanced_options_button] = dict(row=current_row_for_dynamic_elements, column=1, padx=5, pady=5, sticky=SE)
+
+        if self._apply_grid_layout("output", layout):
+            self.toggle_advanced_options_button.master.columnconfigure(1, weight=1)
+            self.toggle_advanced_options_button.master.grid_rowconfigure(current_row_for_dynamic_elements, weight=1)
+            self._request_scroll_update()
+        elif advanced_changed:
+            self._request_scroll_update()
 
 
     def select_channel(self, channel_name):
@@ -896,23 +1436,47 @@ class FFmpegStreamerApp:
 
         self.current_channel = channel_name
         self.app_config["last_selected_channel"] = channel_name # Update last selected channel
-        save_app_config(self.app_config) # Save config immediately
-        self.logger.info(f"Current channel set to '{channel_name}'. App config saved.")
+        self._schedule_app_config_save() # Debounced; written off the UI thread
+        self.logger.info(f"Current channel set to '{channel_name}'. App config save scheduled.")
 
         self.config_frame.config(text=f"Configuration for {self.channels[channel_name]['display_name']}")
         self.load_channel_config()
         self.logger.debug(f"Loaded config for current channel: {channel_name}")
         
-        # Trigger a refresh to ensure all statuses are up-to-date after channel switch.
+        # Update the UI and refresh all statuses in one callback after the channel switch.
         # This is where the status of the newly selected channel will be determined
         # based on its UDP listener state (if UDP) or URL presence (if non-UDP).
-        self.master.after(0, self._refresh_all_stream_statuses)
-        self.master.after(0, self.update_ui_for_channel) # Update UI after loading new channel config
+        self.master.after(0, self._post_select_channel)
+
+    def _post_select_channel(self):
+        """Runs after a channel switch: updates the UI for the loaded config, then refreshes all statuses."""
+        self.update_ui_for_channel() # Cheap, local widget state first
+        self._refresh_all_stream_statuses()
+
+    def _schedule_app_config_save(self):
+        """(Re)starts the debounce timer for writing config.json, so rapid channel clicks cause a single write."""
+        if self._app_config_save_after_id is not None:
+            self.master.after_cancel(self._app_config_save_after_id)
+        self._app_config_save_after_id = self.master.after(APP_CONFIG_SAVE_DEBOUNCE_MS, self._flush_app_config_save)
+
+    def _flush_app_config_save(self):
+        """Writes a snapshot of the app config to disk on the config-save worker, keeping the fsync off the mainloop."""
+        self._app_config_save_after_id = None
+        self._app_config_save_pool.submit(save_app_config, dict(self.app_config)) # save_app_config reports its own errors
+
+    def _get_channel_view(self, channel_name):
+        """Returns the cached ChannelView for a channel, building it from its config on first use (may raise ValueError)."""
+        view = self._channel_views.get(channel_name)
+        if view is None:
+            view = ChannelView.from_config(self.channels[channel_name]["config"])
+            self._channel_views[channel_name] = view
+        return view
 
     def save_current_config_to_memory(self):
         """Saves the current UI input values into the selected channel's configuration dictionary."""
         if not self.current_channel: return
         config = self.channels[self.current_channel]["config"]
+        self._channel_views.pop(self.current_channel, None) # Config is about to change; rebuild the view on next use
         self.channels[self.current_channel]["display_name"] = self.display_name_var.get()
         config["input_type"] = self.input_type_var.get()
         config["input_ip"] = self.input_ip_var.get()
@@ -943,7 +1507,7 @@ class FFmpegStreamerApp:
         # Save the selected program ID
         if self.input_type_var.get() == "UDP" and self.program_id_var.get():
             selected_text = self.program_id_var.get()
-            match = re.search(r'\(ID: (\d+)\)', selected_text)
+            match = PROGRAM_ID_RE.search(selected_text)
             if match:
                 config["program_id"] = match.group(1)
             else:
@@ -951,34 +1515,53 @@ class FFmpegStreamerApp:
         else:
             config["program_id"] = "" # Clear for non-UDP or no selection
 
+    def _set_program_combo_values(self, values):
+        """Assigns the Program ID combobox values, skipping the Tcl list rebuild when they are unchanged."""
+        values = tuple(values)
+        if values != self._program_combo_values:
+            self.program_id_combo['values'] = values
+            self._program_combo_values = values
+
+    def _select_program_combo_index(self, index):
+        """Selects entry `index` of the Program ID combobox unless it is already the shown value."""
+        if self.program_id_var.get() != self._program_combo_values[index]:
+            self.program_id_combo.current(index)
+
     def load_channel_config(self):
         """Loads the selected channel's configuration from memory into the UI input fields."""
         if not self.current_channel: return
         channel_data = self.channels[self.current_channel]
-        config = channel_data["config"]
-
-        self.display_name_var.set(channel_data.get("display_name", self.current_channel))
-        self.input_type_var.set(config.get("input_type", "UDP"))
-        self.input_ip_var.set(config.get("input_ip", ""))
-        self.input_port_var.set(config.get("input_port", ""))
-        self.input_url_var.set(config.get("input_url", ""))
-        self.output_type_var.set(config.get("output_type", "UDP"))
-        self.output_ip_var.set(config.get("output_ip", ""))
-        self.output_port_var.set(config.get("output_port", ""))
-        self.output_url_var.set(config.get("output_url", "")) # For RTMP
-        self.video_bitrate_var.set(config.get("video_bitrate", "2000"))
-        self.srt_mode_var.set(config.get("srt_mode", "listener"))
-        self.local_bind_interface_var.set(config.get("local_bind_interface", "Auto"))
-        self.output_srt_mode_var.set(config.get("output_srt_mode", "caller")) # Output SRT mode
-        self.output_srt_latency_var.set(config.get("output_srt_latency", "5000"))
-        self.output_srt_maxbw_var.set(config.get("output_srt_maxbw", "0"))
-        self.output_srt_tsbpdmode_var.set(config.get("output_srt_tsbpdmode", "True"))
-        self.output_srt_sndbuf_var.set(config.get("output_srt_sndbuf", "8000000"))
-        self.output_srt_rcvbuf_var.set(config.get("output_srt_rcvbuf", "8000000"))
-        self.output_udp_pkt_size_var.set(config.get("output_udp_pkt_size", "1316"))
-        self.input_probesize_var.set(config.get("input_probesize", "10M"))
-        self.input_analyzeduration_var.set(config.get("input_analyzeduration", "10M"))
-        self.output_max_delay_var.set(config.get("output_max_delay", "0"))
+        # One merge with the defaults (usually a no-op, since load_channels_config already merged them) replaces per-key .get() defaults
+        config = {**DEFAULT_CONFIG_CHANNEL_CONFIG, **channel_data["config"]}
+
+        # display_name_var is the only traced variable; suppress its write-trace while loading, since the value
+        # comes from self.channels already and the trace would only write it back and queue a redundant refresh
+        self._loading_config = True
+        try:
+            self.display_name_var.set(channel_data.get("display_name", self.current_channel))
+        finally:
+            self._loading_config = False
+        self.input_type_var.set(config["input_type"])
+        self.input_ip_var.set(config["input_ip"])
+        self.input_port_var.set(config["input_port"])
+        self.input_url_var.set(config["input_url"])
+        self.output_type_var.set(config["output_type"])
+        self.output_ip_var.set(config["output_ip"])
+        self.output_port_var.set(config["output_port"])
+        self.output_url_var.set(config["output_url"]) # For RTMP
+        self.video_bitrate_var.set(config["video_bitrate"])
+        self.srt_mode_var.set(config["srt_mode"])
+        self.local_bind_interface_var.set(config["local_bind_interface"])
+        self.output_srt_mode_var.set(config["output_srt_mode"]) # Output SRT mode
+        self.output_srt_latency_var.set(config["output_srt_latency"])
+        self.output_srt_maxbw_var.set(config["output_srt_maxbw"])
+        self.output_srt_tsbpdmode_var.set(config["output_srt_tsbpdmode"])
+        self.output_srt_sndbuf_var.set(config["output_srt_sndbuf"])
+        self.output_srt_rcvbuf_var.set(config["output_srt_rcvbuf"])
+        self.output_udp_pkt_size_var.set(config["output_udp_pkt_size"])
+        self.input_probesize_var.set(config["input_probesize"])
+        self.input_analyzeduration_var.set(config["input_analyzeduration"])
+        self.output_max_delay_var.set(config["output_max_delay"])
         
         self.on_input_type_change()
         self.on_output_type_change() # Call this to set visibility based on loaded type
@@ -987,247 +1570,201 @@ class FFmpegStreamerApp:
         if self.input_type_var.get() == "UDP":
             if programs:
                 display_list = []
+                id_to_index = {} # {program_id (str): index in display_list}, for O(1) selection restore
+                video_by_id = {} # {program_id (str): has video stream}, for the input preview check
                 has_video = False
                 for p in programs:
                     program_id = p['program_id']
                     service_name = p['tags'].get('service_name', 'Unknown')
                     
                     # Check if the program has any video streams
-                    program_has_video = any(stream.get('codec_type') == 'video' for stream in p.get('streams', []))
+                    program_has_video = any(stream.get('codec_type') == 'video' for stream in p.get('streams', ()))
                     
                     if program_has_video:
                         display_list.append(f"{service_name} (ID: {program_id}) [Video]")
                         has_video = True
                     else:
                         display_list.append(f"{service_name} (ID: {program_id}) [No Video]")
+                    id_to_index.setdefault(str(program_id), len(display_list) - 1)
+                    video_by_id.setdefault(str(program_id), program_has_video)
                 
                 self.channels[self.current_channel]["has_any_video_stream_detected"] = has_video # Store this info
-                self.program_id_combo['values'] = display_list
+                self._program_has_video[self.current_channel] = video_by_id
+                self._set_program_combo_values(display_list)
                 config = self.channels[self.current_channel]["config"] # Get config to load saved program_id
                 selected_program_id = config.get("program_id") # Get saved program_id
                 if selected_program_id:
-                    found = False
-                    for i, item in enumerate(display_list):
-                        if f"(ID: {selected_program_id})" in item:
-                            self.program_id_combo.current(i)
-                            found = True
-                            break
-                    if not found:
+                    idx = id_to_index.get(str(selected_program_id))
+                    if idx is not None:
+                        self._select_program_combo_index(idx)
+                    else:
                         self.program_id_combo.set("Previously selected service not found")
                 elif display_list:
-                    self.program_id_combo.current(0) # Select first if no previous selection
+                    self._select_program_combo_index(0) # Select first if no previous selection
                 else:
                     self.program_id_var.set("No services found")
             else:
                 self.channels[self.current_channel]["has_any_video_stream_detected"] = False
-                self.program_id_combo['values'] = []
+                self._set_program_combo_values(())
                 self.program_id_var.set("No services found")
         else:
             self.channels[self.current_channel]["has_any_video_stream_detected"] = False
-            self.program_id_combo['values'] = []
+            self._set_program_combo_values(())
             if self.input_type_var.get() == "SRT":
                 self.program_id_var.set("N/A for SRT")
             else:
                 self.program_id_var.set("N/A for this input type")
 
-    def update_ui_for_channel(self):
+    def _get_stateful_widgets(self):
         """
-        Updates the state (enabled/disabled) of configuration widgets
-        and triggers the update of status indicators based on the current channel's state.
+        Returns cached (entries, comboboxes, buttons) lists of the config widgets that update_ui_for_channel enables/disables:
+        the Entry/Combobox/Button children of the config frame's groups, plus its direct Entry/Button children.
+        Built with one winfo_children walk; reset to None when widgets are added (e.g. the lazy advanced group).
         """
-        if not self.current_channel:
+        if self._stateful_widgets is None:
+            entries, comboboxes, buttons = [], [], []
+            def classify(w):
+                if isinstance(w, ttk.Combobox):
+                    comboboxes.append(w)
+                elif isinstance(w, ttk.Entry):
+                    entries.append(w)
+                elif isinstance(w, ttk.Button):
+                    buttons.append(w)
             for child in self.config_frame.winfo_children():
-                # Skip the action_buttons_frame as it's managed separately
+                # Skip the action_buttons_frame as its buttons are managed separately
                 if child == self.action_buttons_frame:
                     continue
                 if isinstance(child, (ttk.LabelFrame, ttk.Frame)):
                     for w in child.winfo_children():
-                        if isinstance(w, (ttk.Entry, ttk.Button, ttk.Combobox)):
-                            w.config(state='disabled')
-                elif isinstance(child, ttk.Button):
-                     child.config(state='disabled')
+                        classify(w)
+                else:
+                    classify(child)
+            self._stateful_widgets = (entries, comboboxes, buttons)
+        return self._stateful_widgets
+
+    def _set_widgets_state(self, widgets, state):
+        """
+        Sets `state` on each widget whose last applied state differs, so unchanged widgets are not reconfigured/redrawn.
+        The last state is tracked in Python (no cget round-trip), so config widget states must be set through here.
+        """
+        applied = self._widget_states
+        for w in widgets:
+            if applied.get(w) != state:
+                w.config(state=state)
+                applied[w] = state
+
+    def update_ui_for_channel(self):
+        """
+        Updates the state (enabled/disabled) of configuration widgets
+        and triggers the update of status indicators based on the current channel's state.
+        """
+        entries, comboboxes, buttons = self._get_stateful_widgets()
+        if not self.current_channel:
+            if self._ui_state_key is not None:
+                self._ui_state_key = None
+                self._set_widgets_state(entries + comboboxes + buttons, 'disabled')
             # Disable preview buttons if no channel is selected
-            self.preview_input_button.config(state='disabled')
-            self.preview_output_button.config(state='disabled')
+            self._set_preview_button("input", 'disabled', "Preview Input", 'primary.TButton')
+            self._set_preview_button("output", 'disabled', "Preview Output", 'secondary.TButton')
             return
 
         is_streaming = self.current_channel in self.processes
         current_input_status = self.channels[self.current_channel]["input_stream_status"]
-        
-        # Enable/disable config widgets based on streaming status
-        for child in self.config_frame.winfo_children():
-            # Skip the action_buttons_frame as its buttons are managed separately
-            if child == self.action_buttons_frame: 
-                continue 
-
-            if isinstance(child, (ttk.LabelFrame, ttk.Frame)):
-                for w in child.winfo_children():
-                     if isinstance(w, (ttk.Entry, ttk.Combobox)):
-                        w.config(state='disabled' if is_streaming else 'normal')
-                        if isinstance(w, ttk.Combobox):
-                            w.config(state='disabled'if is_streaming else 'readonly')
-            elif isinstance(child, ttk.Entry):
-                child.config(state='disabled' if is_streaming else 'normal')
-            
-        self.on_input_type_change()
-        self.on_output_type_change() # Re-evaluate output type visibility
-        
-        self.start_button.config(state='disabled' if is_streaming else 'normal')
-        self.stop_button.config(state='normal' if is_streaming else 'disabled')
-        self.save_button.config(state='disabled' if is_streaming else 'normal') # Disable save while streaming
-        self.global_refresh_button.config(state='normal') # Always enable global refresh button
+
+        # Config widgets, field layout and action buttons only depend on this key; skip them when it is unchanged
+        ui_state_key = (self.current_channel, is_streaming, self.input_type_var.get(), self.output_type_var.get())
+        if ui_state_key != self._ui_state_key:
+            self._ui_state_key = ui_state_key
+            # Enable/disable config widgets based on streaming status
+            self._set_widgets_state(entries, 'disabled' if is_streaming else 'normal')
+            self._set_widgets_state(comboboxes, 'disabled' if is_streaming else 'readonly')
+
+            self.on_input_type_change()
+            self.on_output_type_change() # Re-evaluate output type visibility
+
+            self._set_widgets_state((self.start_button,), 'disabled' if is_streaming else 'normal')
+            self._set_widgets_state((self.stop_button,), 'normal' if is_streaming else 'disabled')
+            self._set_widgets_state((self.save_button,), 'disabled' if is_streaming else 'normal') # Disable save while streaming
+            self._set_widgets_state((self.global_refresh_button,), 'normal') # Always enable global refresh button
         
         # Preview button logic:
         # Input Preview Button
         # The input preview button should be enabled if the input stream is 'available' (has packets), 'streaming', or 'starting' (UDP listener active).
         # It should be disabled if 'unavailable' (no packets/error) or 'unknown' (not UDP, or UDP listener not started).
-        if current_input_status in ["available", "streaming", "starting"]:
-            self.preview_input_button.config(state='normal')
+        if current_input_status in PREVIEWABLE_INPUT_STATUSES:
             if self.preview_running and self.current_preview_type == "input":
-                self.preview_input_button.config(text="Stop Input Preview", style='warning.TButton')
+                self._set_preview_button("input", 'normal', "Stop Input Preview", 'warning.TButton')
             else:
-                self.preview_input_button.config(text="Preview Input", style='primary.TButton')
+                self._set_preview_button("input", 'normal', "Preview Input", 'primary.TButton')
         else:
-            self.preview_input_button.config(state='disabled', text="Preview Input", style='primary.TButton')
+            self._set_preview_button("input", 'disabled', "Preview Input", 'primary.TButton')
 
         # Output Preview Button (always enabled if a channel is selected, assuming output config is valid)
-        if self.current_channel: # If a channel is selected, output preview is generally possible
-            self.preview_output_button.config(state='normal')
-            if self.preview_running and self.current_preview_type == "output":
-                self.preview_output_button.config(text="Stop Output Preview", style='warning.TButton')
-            else:
-                self.preview_output_button.config(text="Preview Output", style='secondary.TButton')
+        if self.preview_running and self.current_preview_type == "output":
+            self._set_preview_button("output", 'normal', "Stop Output Preview", 'warning.TButton')
         else:
-            self.preview_output_button.config(state='disabled', text="Preview Output", style='secondary.TButton')
-        
+            self._set_preview_button("output", 'normal', "Preview Output", 'secondary.TButton')
+
+    def _set_preview_button(self, preview_type, state, text, style):
+        """Applies (state, text, style) to the input/output preview button, skipping the Tk call if nothing changed."""
+        desired = (state, text, style)
+        if self._preview_btn_state[preview_type] != desired:
+            button = self.preview_input_button if preview_type == "input" else self.preview_output_button
+            button.config(state=state, text=text, style=style)
+            self._preview_btn_state[preview_type] = desired
 
     def update_status_indicators(self):
         """
         Updates the color of the small canvas indicators (top bar) and the
         style/color of the channel name buttons (left bar) based on their status.
+        The last applied state of each indicator/button is cached, so only real changes reach Tk.
         """
-        for name, channel_data in self.channels.items():
+        # Walk the widget dicts rather than self.channels: channels without widgets yet cost nothing
+        for name, indicator in self.status_indicators.items():
+            channel_data = self.channels.get(name)
+            if channel_data is None:
+                continue
+            # Determine color and tooltip for status indicator (top block) from input_stream_status
+            indicator_state = STATUS_INDICATOR_STATES.get(channel_data["input_stream_status"], STATUS_INDICATOR_DEFAULT)
+            if self._indicator_cache.get(name) != indicator_state:
+                self.status_canvas.itemconfig(indicator, fill=indicator_state[0])
+                # Update tooltip text
+                tooltip = self.status_tooltips.get(name)
+                if tooltip is not None:
+                    tooltip.text = indicator_state[1] # Update the tooltip text attribute
+                self._indicator_cache[name] = indicator_state
+
+        # Determine style for channel button (left pane) based on the same input_stream_status
+        current = self.current_channel
+        for name, btn in self.channel_buttons.items():
+            channel_data = self.channels.get(name)
+            if channel_data is None:
+                continue
             input_stream_status = channel_data["input_stream_status"]
-            is_streaming = name in self.processes # Check if FFmpeg process is running for this channel
-            is_current_channel = (name == self.current_channel)
+            if name == current:
+                # If it's the current selected channel, use a filled style
+                btn_style = STATUS_BUTTON_STYLES_SELECTED.get(input_stream_status, STATUS_BUTTON_DEFAULT_SELECTED)
+            else:
+                # If it's not the current selected channel, use outline style for non-streaming
+                btn_style = STATUS_BUTTON_STYLES_UNSELECTED.get(input_stream_status, STATUS_BUTTON_DEFAULT_UNSELECTED)
 
-            # Determine color for status indicator (top block)
-            canvas_color = "grey" # Default: Not configured / Unknown
-            status_text = "Stream Not Started / Unknown Input" # Default tooltip text
-            
-            # Use the input_stream_status directly for both indicators' color logic
-            # Prioritize statuses from most critical to least
-            if input_stream_status == "unavailable":
-                canvas_color = "red"
-                status_text = "Input Missing / Unavailable"
-            elif input_stream_status == "streaming": # This means FFmpeg is running AND input is healthy
-                canvas_color = "green"
-                status_text = "Input Present, Streaming"
-            elif input_stream_status == "available":
-                canvas_color = "yellow"
-                status_text = "Input Present, Stream Stopped (Ready to Start)"
-            elif input_stream_status == "scanning":
-                canvas_color = "orange"
-                status_text = "Scanning for Services..."
-            elif input_stream_status == "starting": # New state for blue
-                canvas_color = "blue" # ttkbootstrap 'info' style is light blue
-                status_text = "Looking for Input (Waiting for Packets)"
-            else: # "unknown" or any other unhandled status
-                canvas_color = "grey"
-                status_text = "Stream Not Started / Unknown Input"
-            
-            if name in self.status_indicators:
-                self.status_indicators[name].config(bg=canvas_color)
-                # Update tooltip text
-                if name in self.status_tooltips:
-                    self.status_tooltips[name].text = status_text # Update the tooltip text attribute
-            
-            # Determine style for channel button (left pane) based on the same input_stream_status
-            if name in self.channel_buttons:
-                btn = self.channel_buttons[name]
-                
-                if is_current_channel:
-                    # If it's the current selected channel, use a filled style
-                    if input_stream_status == "streaming":
-                        btn_style = 'success.TButton' # Green for streaming
-                    elif input_stream_status == "available":
-                        btn_style = 'warning.TButton' # Yellow for input locked/available
-                    elif input_stream_status == "scanning":
-                        btn_style = 'info.TButton' # Light blue/cyan for scanning
-                    elif input_stream_status == "unavailable":
-                        btn_style = 'danger.TButton' # Red for input not locked/unavailable
-                    elif input_stream_status == "starting":
-                        btn_style = 'primary.TButton' # Blue for looking for input
-                    else:
-                        btn_style = 'primary.TButton' # Default for selected but unknown status
-                else:
-                    # If it's not the current selected channel, use outline style for non-streaming
-                    if input_stream_status == "streaming":
-                        btn_style = 'success.TButton' # Still green if streaming
-                    elif input_stream_status == "unavailable":
-                        btn_style = 'outline-danger.TButton' # Outline red
-                    elif input_stream_status == "available":
-                        btn_style = 'outline-warning.TButton' # Outline yellow
-                    elif input_stream_status == "scanning":
-                        btn_style = 'outline-info.TButton' # Outline light blue/cyan
-                    elif input_stream_status == "starting":
-                        btn_style = 'outline-primary.TButton' # Outline blue
-                    else:
-                        btn_style = 'outline-secondary.TButton' # Default outline style
-                
-                btn.config(text=channel_data["display_name"], style=btn_style)
+            button_state = (channel_data["display_name"], btn_style)
+            if self._button_cache.get(name) != button_state:
+                btn.config(text=button_state[0], style=btn_style)
+                self._button_cache[name] = button_state
 
 
     def get_input_url(self, config):
         """Constructs the full FFmpeg input URL based on the channel's configuration."""
-        if config['input_type'] in ["HLS (M3U8)", "YouTube"]:
-            return config['input_url']
-        elif config['input_type'] == "UDP":
-            return f"udp://@{config['input_ip']}:{config['input_port']}"
-        elif config['input_type'] == "SRT":
-            return f"srt://{config['input_ip']}:{config['input_port']}?mode={config['srt_mode']}"
-        return ""
+        return _build_input_url(config['input_type'], config['input_ip'], config['input_port'],
+                                config['input_url'], config['srt_mode'])
 
     def get_output_url(self, config):
         """Constructs the full FFmpeg output URL based on the channel's configuration."""
-        output_type = config['output_type']
-        output_ip = config['output_ip']
-        output_port = config['output_port']
-        output_url = config['output_url'] # For RTMP
-
-        if output_type == "UDP":
-            return f"udp://@{output_ip}:{output_port}"
-        elif output_type == "SRT":
-            mode = config['output_srt_mode']
-            ip = output_ip
-            if mode == "listener" and not ip:
-                ip = "0.0.0.0" # Default to bind to all interfaces if listener and no IP specified
-            
-            srt_params = []
-            if config.get('output_srt_latency') and config['output_srt_latency'] != "0":
-                srt_params.append(f"latency={config['output_srt_latency']}")
-            if config.get('output_srt_maxbw') and config['output_srt_maxbw'] != "0":
-                srt_params.append(f"maxbw={config['output_srt_maxbw']}")
-            if config.get('output_srt_tsbpdmode') in ["True", "False"]:
-                srt_params.append(f"tsbpdmode={config['output_srt_tsbpdmode'].lower()}")
-            if config.get('output_srt_sndbuf') and config['output_srt_sndbuf'] != "0":
-                srt_params.append(f"sndbuf={config['output_srt_sndbuf']}")
-            if config.get('output_srt_rcvbuf') and config['output_srt_rcvbuf'] != "0":
-                srt_params.append(f"rcvbuf={config['output_srt_rcvbuf']}")
-
-            params_string = ""
-            if srt_params:
-                params_string = f"?mode={mode}&{'&'.join(srt_params)}"
-            else:
-                params_string = f"?mode={mode}"
-
-            return f"srt://{ip}:{output_port}{params_string}"
-        elif output_type == "RTMP":
-            return output_url
-        elif output_type == "RTP":
-            rtp_protocol = config.get("output_rtp_protocol", "udp")
-            return f"{rtp_protocol}://{output_ip}:{output_port}"
-        return ""
+        return _build_output_url(config['output_type'], config['output_ip'], config['output_port'], config['output_url'],
+                                 config['output_srt_mode'], config.get('output_srt_latency'), config.get('output_srt_maxbw'),
+                                 config.get('output_srt_tsbpdmode'), config.get('output_srt_sndbuf'),
+                                 config.get('output_srt_rcvbuf'), config.get("output_rtp_protocol", "udp"))
         
     def start_stream(self):
         """
@@ -1240,8 +1777,13 @@ class FFmpegStreamerApp:
             
         self.save_current_config_to_memory() # Ensure latest UI values are saved
         save_channels_config(self.channels) # Persist channel config
+        self._start_stream_for(self.current_channel)
 
-        channel_name = self.current_channel
+    def _start_stream_for(self, channel_name):
+        """
+        Starts the FFmpeg process for any channel from its in-memory config.
+        Leaves current_channel and the config widgets alone, so auto-starts need no UI round-trip.
+        """
         current_channel_config = self.channels[channel_name]["config"]
 
         # --- Duplicate UDP Input Port Check ---
@@ -1249,19 +1791,16 @@ class FFmpegStreamerApp:
             current_input_ip = current_channel_config["input_ip"]
             current_input_port = current_channel_config["input_port"]
             
-            for name, channel_data in self.channels.items():
-                if name != channel_name and name in self.processes: # Check other active channels
-                    other_config = channel_data["config"]
-                    if (other_config["input_type"] == "UDP" and
-                        other_config["input_ip"] == current_input_ip and
-                        other_config["input_port"] == current_input_port):
-                        messagebox.showerror(
-                            "Duplicate Input Port",
-                            f"The input UDP address {current_input_ip}:{current_input_port} is already in use by active stream '{channel_data['display_name']}'.\n"
-                            "Please choose a different input port or stop the conflicting stream."
-                        )
-                        self.logger.error(f"Attempted to start stream for '{channel_name}' on duplicate UDP input {current_input_ip}:{current_input_port}.")
-                        return # Prevent starting the stream
+            # Active UDP inputs are indexed by (ip, port), so this is one lookup instead of a scan of all channels
+            conflicting = self._active_udp_inputs.get((current_input_ip, current_input_port))
+            if conflicting and conflicting != channel_name and conflicting in self.processes:
+                messagebox.showerror(
+                    "Duplicate Input Port",
+                    f"The input UDP address {current_input_ip}:{current_input_port} is already in use by active stream '{self.channels[conflicting]['display_name']}'.\n"
+                    "Please choose a different input port or stop the conflicting stream."
+                )
+                self.logger.error(f"Attempted to start stream for '{channel_name}' on duplicate UDP input {current_input_ip}:{current_input_port}.")
+                return # Prevent starting the stream
 
         # Set stream_stop_requested to False as this is a user-initiated start
         self.stream_stop_requested[channel_name] = False
@@ -1273,11 +1812,17 @@ class FFmpegStreamerApp:
         thread.daemon = True
         thread.start()
 
-    def _start_stream_thread(self, channel_name, retry_count=0):
+    def _release_udp_input(self, channel_name):
+        """Drops the channel's entry from the active UDP input index once its FFmpeg process is gone."""
+        for key, name in list(self._active_udp_inputs.items()):
+            if name == channel_name:
+                del self._active_udp_inputs[key]
+
+    def _start_stream_thread(self, channel_name):
         """
         Worker thread function to prepare and execute the FFmpeg command.
         Handles YouTube URL resolution via yt-dlp if necessary.
-        Includes retry logic.
+        Includes retry logic: the command is built once and Popen is retried in a loop.
         """
         config = self.channels[channel_name]["config"]
         
@@ -1289,23 +1834,20 @@ class FFmpegStreamerApp:
             self.master.after(0, self._set_input_stream_status, channel_name, "unavailable") # Set red status
             return
 
-        # Prepare popen_kwargs for subprocess.Popen
-        popen_kwargs = {
-            'stdout': subprocess.DEVNULL,
-            'stderr': subprocess.PIPE
-        }
-        if os.name == 'nt': # Only add creationflags on Windows
-            popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-
-        if config['input_type'] == 'YouTube':
+        cached = self._yt_url_cache.get(config['input_url']) if config['input_type'] == 'YouTube' else None
+        if cached and cached[1] > time.monotonic():
+            input_url = cached[0]
+            self.logger.info(f"[{channel_name}] Reusing cached YouTube stream URL. Starting ffmpeg.")
+        elif config['input_type'] == 'YouTube':
             self.logger.info(f"[{channel_name}] Looking up YouTube stream URL...")
             try:
                 yt_dlp_cmd = ['yt-dlp', '-g', '-f', 'best', config['input_url']]
-                # Use popen_kwargs to hide the yt-dlp console window
-                result = subprocess.run(yt_dlp_cmd, capture_output=True, text=True, check=True, timeout=20, **popen_kwargs)
+                # capture_output supplies stdout/stderr itself, so only the window flag is passed along
+                result = subprocess.run(yt_dlp_cmd, capture_output=True, text=True, check=True, timeout=20, **NO_WINDOW_KWARGS)
                 input_url = result.stdout.strip()
                 if not input_url:
                     raise ValueError("yt-dlp returned an empty URL.")
+                self._yt_url_cache[config['input_url']] = (input_url, time.monotonic() + YOUTUBE_URL_CACHE_TTL)
                 self.logger.info(f"[{channel_name}] YouTube URL found. Starting ffmpeg.")
             except subprocess.CalledProcessError as e:
                 # Log stderr for more specific yt-dlp errors
@@ -1321,161 +1863,160 @@ class FFmpegStreamerApp:
                 self.master.after(0, self._set_input_stream_status, channel_name, "unavailable") # Set red status
                 return
 
-        command = [
-            'ffmpeg',
-            '-loglevel', self.app_config["ffmpeg_loglevel"],
-        ]
-        
-        # Add global input options
-        if config.get('input_analyzeduration') and config['input_analyzeduration'] != "0":
-            command.extend(['-analyzeduration', config['input_analyzeduration']])
-        if config.get('input_probesize') and config['input_probesize'] != "0":
-            command.extend(['-probesize', config['input_probesize']])
+        command = self._build_ffmpeg_command(config, input_url, output_url)
 
-        if config['local_bind_interface'] != "Auto" and config['input_type'] in ["UDP", "SRT"]:
-            command.extend(['-bind_address', config['local_bind_interface']])
+        # Log the FFmpeg command and explain advanced parameters (once, not per retry; the join only runs if INFO is emitted)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(f"[{channel_name}] FFmpeg Command: {' '.join(command)}")
+            self._log_advanced_ffmpeg_params(channel_name, config)
 
-        command.extend([
-            '-i', input_url
-        ])
-        
-        if config["input_type"] == "UDP" and config["program_id"]:
-            command.extend(['-map', f"0:p:{config['program_id']}"])
+        retry_count = 0
+        while True:
+            self.logger.info(f"Starting stream for '{channel_name}' (Attempt {retry_count + 1}/{self.app_config['retry_attempts'] + 1})...")
+            try:
+                # UDP listener should already be running from __init__ or save_and_validate_config
+                # if config['input_type'] == "UDP":
+                #     if channel_name not in self.udp_listeners:
+                #         udp_ip = config['input_ip']
+                #         udp_port = int(config['input_port'])
+                #         bind_address = config['local_bind_interface']
+                #         if bind_address == "Auto":
+                #             bind_address = "0.0.0.0"
+                #         if not self._start_udp_listener(channel_name, udp_ip, udp_port, bind_address):
+                #             self.master.after(0, self._set_input_stream_status, channel_name, "unavailable")
+                #             return # Do not proceed with FFmpeg if UDP listener failed to start
+
+                proc = subprocess.Popen(command, **STREAM_POPEN_KWARGS)
+
+                self.processes[channel_name] = proc
+                if config["input_type"] == "UDP":
+                    self._active_udp_inputs[(config["input_ip"], config["input_port"])] = channel_name
+            
+                # Start stderr monitoring (for critical startup errors)
+                if self._stderr_selector is not None:
+                    self.stderr_monitors[channel_name] = self._watch_ffmpeg_stderr(proc, channel_name)
+                else:
+                    stderr_monitor_thread = threading.Thread(target=self._monitor_ffmpeg_stderr, args=(proc, channel_name))
+                    stderr_monitor_thread.daemon = True
+                    stderr_monitor_thread.start()
+                    self.stderr_monitors[channel_name] = stderr_monitor_thread
+
+                if not self._watch_process_exit(proc, channel_name):
+                    # Start process monitor thread
+                    monitor_thread = threading.Thread(target=self.monitor_process, args=(proc, channel_name))
+                    monitor_thread.daemon = True
+                    monitor_thread.start()
+
+                self.master.after(0, self._schedule_refresh)
+                self.logger.info(f"[{channel_name}] FFmpeg process started successfully.")
+                # Trigger a refresh to update status immediately after starting stream
+                self.master.after(0, self._schedule_refresh, True)
+                return # Exit loop if successful
+            except Exception as e:
+                error_msg = str(e)
+                self.logger.error(f"[{channel_name}] Failed to start ffmpeg: {error_msg}")
+            
+                # Clean up any resources that might have been started
+                if channel_name in self.stderr_monitors:
+                    del self.stderr_monitors[channel_name]
+            
+                if retry_count < self.app_config["retry_attempts"]:
+                    self.logger.warning(f"[{channel_name}] Retrying in {self.app_config['retry_delay_seconds']} seconds (Attempt {retry_count + 1}/{self.app_config['retry_attempts'] + 1})...")
+                    time.sleep(self.app_config['retry_delay_seconds'])
+                    retry_count += 1
+                else:
+                    self.logger.critical(f"[{channel_name}] ALARM: Max retry attempts reached. Stream will not start.")
+                    self.master.after(0, self._set_input_stream_status, channel_name, "unavailable") # Set red status
+                    messagebox.showerror("Stream Startup Failed",
+                                         f"Failed to start stream for '{self.channels[channel_name]['display_name']}' after multiple retries.\n"
+                                         "Please check input configuration and FFmpeg logs for details.")
+                    return
+
+    def _build_ffmpeg_command(self, config, input_url, output_url):
+        """Builds the FFmpeg command line for a channel from its config and resolved input/output URLs."""
+        # Read each config field once
+        input_type = config['input_type']
+        output_type = config['output_type']
+        analyzeduration = config.get('input_analyzeduration')
+        probesize = config.get('input_probesize')
+        bind_interface = config['local_bind_interface']
+        program_id = config['program_id']
+        max_delay = config.get('output_max_delay')
+        udp_pkt_size = config.get('output_udp_pkt_size')
+
+        # Add global input options
+        input_opts = []
+        if analyzeduration and analyzeduration != "0":
+            input_opts += ('-analyzeduration', analyzeduration)
+        if probesize and probesize != "0":
+            input_opts += ('-probesize', probesize)
+        if bind_interface != "Auto" and input_type in ["UDP", "SRT"]:
+            input_opts += ('-bind_address', bind_interface)
+
+        if input_type == "UDP" and program_id:
+            map_args = ('-map', f"0:p:{program_id}")
         else:
-            command.extend(['-map', '0:v:0?', '-map', '0:a:0?']) # Use optional mapping
+            map_args = FFMPEG_DEFAULT_MAP_ARGS
 
-        command.extend([
-            '-c:v', 'libx264',
-            '-pix_fmt', 'yuv420p',
-            '-b:v', f'{config["video_bitrate"]}k',
-            '-c:a', 'copy',
-            '-flags', '+global_header',
-            '-g', '50',
-            '-bsf:v', 'h264_mp4toannexb'
-        ])
-        
-        # Output format and URL based on selected output type
-        output_type = config['output_type']
-        output_format = 'mpegts' # Default for UDP/SRT
-        
-        if output_type == "RTMP":
-            output_format = 'flv' # RTMP uses FLV container
-        elif output_type == "RTP":
-            output_format = 'rtp' # RTP uses RTP protocol
-            # Add RTP specific options if needed, e.g., payload type
-            command.extend(['-payload_type', config.get('output_rtp_payload_type', '96')])
-        
         # Add output specific options
-        if config.get('output_max_delay') and config['output_max_delay'] != "0":
-            command.extend(['-max_delay', config['output_max_delay']])
-        
-        if output_type == "UDP" and config.get('output_udp_pkt_size') and config['output_udp_pkt_size'] != "0":
-            command.extend(['-pkt_size', config['output_udp_pkt_size']])
-
-        command.extend(['-f', output_format, output_url])
+        output_opts = []
+        if output_type == "RTP":
+            # Add RTP specific options if needed, e.g., payload type
+            output_opts += ('-payload_type', config.get('output_rtp_payload_type', '96'))
+        if max_delay and max_delay != "0":
+            output_opts += ('-max_delay', max_delay)
+        if output_type == "UDP" and udp_pkt_size and udp_pkt_size != "0":
+            output_opts += ('-pkt_size', udp_pkt_size)
+
+        # Assemble the whole command in a single list display
+        return [
+            'ffmpeg',
+            '-loglevel', self.app_config["ffmpeg_loglevel"],
+            *input_opts,
+            '-i', input_url,
+            *map_args,
+            *FFMPEG_VIDEO_CODEC_ARGS,
+            '-b:v', f'{config["video_bitrate"]}k',
+            *FFMPEG_AUDIO_MUX_ARGS,
+            *output_opts,
+            '-f', FFMPEG_OUTPUT_FORMATS.get(output_type, 'mpegts'), output_url,
+        ]
 
-        self.logger.info(f"Starting stream for '{channel_name}' (Attempt {retry_count + 1}/{self.app_config['retry_attempts'] + 1})...")
-        
-        # Log the FFmpeg command and explain advanced parameters
-        ffmpeg_command_str = ' '.join(command)
-        self.logger.info(f"[{channel_name}] FFmpeg Command: {ffmpeg_command_str}")
-        
-        advanced_params_explanation = []
-        if config.get('input_analyzeduration') and config['input_analyzeduration'] != "0":
-            advanced_params_explanation.append(f"-analyzeduration {config['input_analyzeduration']}: Increases the duration FFmpeg analyzes the input to detect stream properties, improving stream stability and reducing 'no data' errors.")
-        if config.get('input_probesize') and config['input_probesize'] != "0":
-            advanced_params_explanation.append(f"-probesize {config['input_probesize']}: Increases the amount of data FFmpeg reads from the input to determine stream format and codecs, crucial for complex or fragmented inputs.")
-        if config.get('output_max_delay') and config['output_max_delay'] != "0":
-            advanced_params_explanation.append(f"-max_delay {config['output_max_delay']}us: Sets the maximum demuxing delay in microseconds. A higher value can help buffer against input stream fluctuations, reducing stuttering.")
-        if output_type == "SRT":
-            if config.get('output_srt_latency') and config['output_srt_latency'] != "0":
-                advanced_params_explanation.append(f"SRT latency={config['output_srt_latency']}ms: Buffers more data before playback, providing a larger window for retransmissions and smoothing out network jitter.")
-            if config.get('output_srt_maxbw') and config['output_srt_maxbw'] != "0":
-                advanced_params_explanation.append(f"SRT maxbw={config['output_srt_maxbw']}pkts/s: Sets the maximum bandwidth for SRT in packets per second (0 for unlimited).")
-            if config.get('output_srt_tsbpdmode') == "True":
-                advanced_params_explanation.append(f"SRT tsbpdmode=true: Time-Based Sender-Side Packet Delivery mode. Ensures packets are delivered based on their timestamps, improving synchronization and reducing jitter.")
-            if config.get('output_srt_sndbuf') and config['output_srt_sndbuf'] != "0":
-                advanced_params_explanation.append(f"SRT sndbuf={config['output_srt_sndbuf']} bytes: Sets the SRT send buffer size. A larger buffer can absorb more data before transmission, reducing drops.")
-            if config.get('output_srt_rcvbuf') and config['output_srt_rcvbuf'] != "0":
-                advanced_params_explanation.append(f"SRT rcvbuf={config['output_srt_rcvbuf']} bytes: Sets the SRT receive buffer size. A larger buffer helps absorb network fluctuations and retransmitted packets.")
-        if output_type == "UDP" and config.get('output_udp_pkt_size') and config['output_udp_pkt_size'] != "0":
-            advanced_params_explanation.append(f"-pkt_size {config['output_udp_pkt_size']}: Sets the UDP packet size. For MPEG-TS, 1316 bytes is common to fit within typical MTU, reducing fragmentation and potential loss.")
+    def _log_advanced_ffmpeg_params(self, channel_name, config):
+        """Logs an explanation of the advanced FFmpeg parameters in use for a channel (callers check INFO is enabled)."""
+        output_type = config['output_type']
+        advanced_params_explanation = "\n".join(
+            template.format(value)
+            for only_output_type, key, required_value, template in FFMPEG_ADVANCED_PARAM_NOTES
+            if only_output_type is None or only_output_type == output_type
+            for value in (config.get(key),) # One lookup per note, reused by the test and the message
+            if (value == required_value if required_value is not None else value and value != "0"))
 
         if advanced_params_explanation:
-            self.logger.info(f"[{channel_name}] Advanced FFmpeg Parameters for Robust Streaming:\n" + "\n".join(advanced_params_explanation))
-
-        try:
-            # UDP listener should already be running from __init__ or save_and_validate_config
-            # if config['input_type'] == "UDP":
-            #     if channel_name not in self.udp_listeners:
-            #         udp_ip = config['input_ip']
-            #         udp_port = int(config['input_port'])
-            #         bind_address = config['local_bind_interface']
-            #         if bind_address == "Auto":
-            #             bind_address = "0.0.0.0"
-            #         if not self._start_udp_listener(channel_name, udp_ip, udp_port, bind_address):
-            #             self.master.after(0, self._set_input_stream_status, channel_name, "unavailable")
-            #             return # Do not proceed with FFmpeg if UDP listener failed to start
-
-            proc = subprocess.Popen(command, **popen_kwargs)
-
-            self.processes[channel_name] = proc
-            
-            # Start stderr monitoring thread (for critical startup errors)
-            stderr_monitor_thread = threading.Thread(target=self._monitor_ffmpeg_stderr, args=(proc, channel_name))
-            stderr_monitor_thread.daemon = True
-            stderr_monitor_thread.start()
-            self.stderr_monitors[channel_name] = stderr_monitor_thread
-
-            # Start process monitor thread
-            monitor_thread = threading.Thread(target=self.monitor_process, args=(proc, channel_name))
-            monitor_thread.daemon = True
-            monitor_thread.start()
-
-            self.master.after(0, self.update_ui_for_channel)
-            self.logger.info(f"[{channel_name}] FFmpeg process started successfully.")
-            # Trigger a refresh to update status immediately after starting stream
-            self.master.after(0, self._refresh_all_stream_statuses)
-            return # Exit loop if successful
-        except Exception as e:
-            error_msg = str(e)
-            self.logger.error(f"[{channel_name}] Failed to start ffmpeg: {error_msg}")
-            
-            # Clean up any resources that might have been started
-            if channel_name in self.stderr_monitors:
-                del self.stderr_monitors[channel_name]
-            
-            if retry_count < self.app_config["retry_attempts"]:
-                self.logger.warning(f"[{channel_name}] Retrying in {self.app_config['retry_delay_seconds']} seconds (Attempt {retry_count + 1}/{self.app_config['retry_attempts'] + 1})...")
-                time.sleep(self.app_config['retry_delay_seconds'])
-                # Re-call this function with incremented retry_count
-                self._start_stream_thread(channel_name, retry_count + 1)
-            else:
-                self.logger.critical(f"[{channel_name}] ALARM: Max retry attempts reached. Stream will not start.")
-                self.master.after(0, self._set_input_stream_status, channel_name, "unavailable") # Set red status
-                messagebox.showerror("Stream Startup Failed",
-                                     f"Failed to start stream for '{self.channels[channel_name]['display_name']}' after multiple retries.\n"
-                                     "Please check input configuration and FFmpeg logs for details.")
-                return
+            self.logger.info(f"[{channel_name}] Advanced FFmpeg Parameters for Robust Streaming:\n" + advanced_params_explanation)
 
     def _start_udp_listener(self, channel_name, ip, port, bind_address):
-        """Starts a UDP listener thread for the given channel."""
+        """Binds a UDP listener socket for the given channel and registers it with the UDP reactor."""
         self.logger.debug(f"[{channel_name}] Attempting to start UDP listener on {bind_address}:{port}...")
         if channel_name in self.udp_listeners:
             self.logger.debug(f"[{channel_name}] UDP listener already running for this channel. Skipping start.")
             # If listener is already running, ensure its status is correctly set based on recent packets
-            self.master.after(0, self._refresh_all_stream_statuses) # Trigger refresh for this channel
+            self.master.after(0, self._schedule_refresh, True) # Trigger refresh for this channel
             return True # Already running
 
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.settimeout(1.0) # Small timeout for non-blocking receive
+            # SOCK_NONBLOCK (Linux) creates the socket non-blocking in the same syscall; setblocking() below covers the rest
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM | getattr(socket, 'SOCK_NONBLOCK', 0))
             
             # Allow reuse of address for quicker restarts
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_LISTENER_RCVBUF_BYTES)
+            except OSError as e:
+                self.logger.debug(f"[{channel_name}] Could not enlarge UDP receive buffer: {e}")
             
-            # For multicast, if it's a multicast address
-            if ip.startswith("224.") or ip.startswith("239."):
+            # For multicast, if it's a multicast address (anywhere in 224.0.0.0/4, including the 232.* SSM range)
+            if _is_multicast_address(ip):
                 self.logger.debug(f"[{channel_name}] Configuring socket for multicast.")
                 sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP,
                                 socket.inet_aton(ip) + socket.inet_aton(bind_address))
@@ -1487,21 +2028,17 @@ class FFmpegStreamerApp:
                     self.logger.warning(f"[{channel_name}] socket.SO_REUSEPORT not available on this system. Skipping.")
             
             sock.bind((bind_address, port))
+            sock.setblocking(False) # The reactor only reads after the selector reports readiness
             self.logger.info(f"[{channel_name}] UDP listener successfully bound to {bind_address}:{port}")
             self.udp_listeners[channel_name] = sock
-            self.udp_packet_timestamps[channel_name] = time.time() # Initialize timestamp
+            self.udp_packet_timestamps[channel_name] = time.monotonic() # Initialize timestamp
+            self.udp_input_live[channel_name] = False
             self._set_input_stream_status(channel_name, "starting") # Set to blue immediately when listener starts
 
-            # Use a threading.Event to signal the thread to stop
-            stop_event = threading.Event()
-            self.udp_listener_active_flags[channel_name] = stop_event
-
-            udp_listener_thread = threading.Thread(target=self._udp_listener_thread, args=(channel_name, sock, stop_event))
-            udp_listener_thread.daemon = True
-            udp_listener_thread.start()
-            self.udp_listener_threads[channel_name] = udp_listener_thread
-            self.logger.debug(f"[{channel_name}] UDP listener thread started.")
-            self.master.after(0, self._refresh_all_stream_statuses) # Trigger refresh after listener starts
+            self.udp_selector.register(sock, selectors.EVENT_READ, data=channel_name)
+            self._wake_udp_reactor() # A select()-based selector only sees the new socket on its next call
+            self.logger.debug(f"[{channel_name}] UDP listener registered with reactor.")
+            self.master.after(0, self._schedule_refresh, True) # Trigger refresh after listener starts
             return True
         except OSError as e:
             error_message = f"[{channel_name}] Failed to bind UDP listener to {bind_address}:{port}: {e}"
@@ -1523,153 +2060,347 @@ class FFmpegStreamerApp:
             return False
 
     def _stop_udp_listener(self, channel_name):
-        """Signals a UDP listener thread to stop and cleans up resources."""
+        """Unregisters a channel's UDP listener socket from the reactor and cleans up resources."""
         self.logger.debug(f"[{channel_name}] Request to stop UDP listener.")
-        if channel_name in self.udp_listener_active_flags:
-            self.logger.info(f"[{channel_name}] Signaling UDP listener thread to stop.")
-            self.udp_listener_active_flags[channel_name].set() # Set the event to signal stop
-            
-            # Safely attempt to join and clean up the thread reference
-            if channel_name in self.udp_listener_threads:
-                thread_to_stop = self.udp_listener_threads[channel_name]
-                if thread_to_stop.is_alive(): # Only try to join if it's still running
-                    self.logger.debug(f"[{channel_name}] Attempting to join UDP listener thread.")
-                    thread_to_stop.join(timeout=1) # Give it a moment to finish
-                    if thread_to_stop.is_alive():
-                        self.logger.warning(f"[{channel_name}] UDP listener thread did not stop gracefully after join.")
-                del self.udp_listener_threads[channel_name] # Always remove from dict after trying to stop
+        if channel_name in self.udp_listeners:
+            self.logger.info(f"[{channel_name}] Stopping UDP listener.")
+            sock = self.udp_listeners.pop(channel_name)
+            try:
+                self.udp_selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass # Never registered, or already unregistered
+            self._wake_udp_reactor() # Don't leave the reactor blocked on a socket that is about to close
+            try:
+                sock.close()
+                self.logger.debug(f"[{channel_name}] UDP listener socket closed.")
+            except Exception as e:
+                self.logger.error(f"[{channel_name}] Error closing UDP listener socket: {e}")
+
+            self.udp_packet_timestamps.pop(channel_name, None)
+            self.udp_input_live.pop(channel_name, None)
 
-            if channel_name in self.udp_listeners:
-                try:
-                    self.udp_listeners[channel_name].close()
-                    self.logger.debug(f"[{channel_name}] UDP listener socket closed.")
-                except Exception as e:
-                    self.logger.error(f"[{channel_name}] Error closing UDP listener socket: {e}")
-                del self.udp_listeners[channel_name]
-            
-            if channel_name in self.udp_packet_timestamps:
-                del self.udp_packet_timestamps[channel_name]
-            del self.udp_listener_active_flags[channel_name]
-            
             # Do NOT set status to unknown here. Let _refresh_all_stream_statuses handle it
             # based on whether the FFmpeg process is running or not.
-            self.master.after(0, self._refresh_all_stream_statuses) # Trigger refresh after listener stops
+            self.master.after(0, self._schedule_refresh, True) # Trigger refresh after listener stops
         else:
             self.logger.debug(f"[{channel_name}] No active UDP listener to stop.")
 
 
-    def _udp_listener_thread(self, channel_name, sock, stop_event):
+    def _wake_udp_reactor(self):
+        """Interrupts the UDP reactor's blocking select() so it picks up listener (un)registrations."""
+        try:
+            self._udp_wakeup_w.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass # Buffer full means a wakeup is already pending; OSError means the app is closing
+
+    def _udp_reactor_thread(self):
         """
-        A dedicated thread to listen for UDP packets on a specific socket.
-        Updates the udp_packet_timestamps for the channel.
+        A single background thread that waits on every UDP listener socket through one selector.
+        Updates the udp_packet_timestamps for whichever channel has a packet ready.
+        Blocks until a packet or a wakeup arrives; there is no polling timeout.
         """
-        self.logger.debug(f"[{channel_name}] UDP listener thread started for {sock.getsockname()}.")
-        try:
-            while not stop_event.is_set(): # Loop until stop event is set
+        self.logger.debug("UDP reactor thread started.")
+        while not self._udp_reactor_stop.is_set():
+            try:
+                events = self.udp_selector.select() # The wakeup socket is always registered, so the set is never empty
+            except Exception as e:
+                if self._udp_reactor_stop.is_set():
+                    break # Selector closed during shutdown
+                self.logger.error(f"UDP reactor select error: {e}")
+                time.sleep(0.5)
+                continue
+
+            for key, _ in events:
+                channel_name = key.data
+                sock = key.fileobj
+                if channel_name is None:
+                    try:
+                        while sock.recv(4096):
+                            pass # Discard queued wakeup bytes
+                    except OSError:
+                        pass # Drained (BlockingIOError) or closed during shutdown
+                    continue
+                if self.udp_listeners.get(channel_name) is not sock:
+                    continue # Listener was stopped after select() returned
+                packets_read = 0
                 try:
-                    data, addr = sock.recvfrom(2048) # Receive up to 2048 bytes (typical for TS packets)
-                    self.udp_packet_timestamps[channel_name] = time.time()
-                    self.logger.debug(f"[{channel_name}] Received UDP packet from {addr}. Timestamp updated.")
-                except socket.timeout:
-                    # No packet received within the timeout, continue loop
-                    pass
-                except Exception as e:
-                    # Log other errors but don't necessarily stop the thread immediately unless critical
+                    if UDP_RECVMMSG_DRAIN is not None:
+                        # One syscall dequeues (and discards) up to a full batch; anything left re-triggers the selector
+                        packets_read = UDP_RECVMMSG_DRAIN(sock.fileno())
+                    else:
+                        # Drain everything queued on this socket in one wakeup (bounded so one busy feed can't starve the rest)
+                        while packets_read < UDP_DRAIN_BATCH_SIZE:
+                            if UDP_DISCARD_PAYLOAD:
+                                sock.recvmsg(0, 0, socket.MSG_TRUNC) # Payload is discarded in the kernel
+                            else:
+                                sock.recv(2048) # Receive up to 2048 bytes (typical for TS packets)
+                            packets_read += 1
+                except BlockingIOError:
+                    pass # Queue drained
+                except OSError as e:
                     self.logger.error(f"[{channel_name}] UDP listener error: {e}")
-                    # If the socket is genuinely broken, set status to unavailable
-                    if isinstance(e, (socket.error, OSError)) and "forcibly closed" in str(e).lower():
+                    # If the socket is genuinely broken, set status to unavailable and drop the listener
+                    if "forcibly closed" in str(e).lower():
                         self.logger.error(f"[{channel_name}] Remedy: UDP socket forcibly closed. This might indicate an external process interfering or a network issue.")
                         self.master.after(0, self._set_input_stream_status, channel_name, "unavailable")
-                        break # Exit the loop on critical socket error
-                time.sleep(0.01) # Small delay to prevent busy-waiting, but allow quick response to stop_event
-        except Exception as thread_exception:
-            self.logger.critical(f"[{channel_name}] ALARM: UDP listener thread crashed with unhandled exception: {thread_exception}")
-            self.master.after(0, self._set_input_stream_status, channel_name, "unavailable")
-        finally:
-            # Clean up socket when the loop exits (handled by _stop_udp_listener for main app flow)
-            # This block is mostly for unexpected thread exits
-            if sock:
-                try:
-                    sock.close()
-                    self.logger.debug(f"[{channel_name}] UDP listener socket closed by thread exit.")
-                except Exception as e:
-                    self.logger.error(f"[{channel_name}] Error closing UDP listener socket on thread exit: {e}")
-            self.logger.debug(f"[{channel_name}] UDP listener thread finished.")
+                        self.master.after(0, self._stop_udp_listener, channel_name)
+                    continue
+                if not packets_read:
+                    continue # Readiness was spurious
+
+                now = time.monotonic()
+                since_last = now - self.udp_packet_timestamps.get(channel_name, 0)
+                if not self.udp_input_live.get(channel_name) or since_last > self.app_config["udp_packet_timeout_seconds"]:
+                    # Packets resumed after a gap: push a refresh instead of waiting for the next sweep
+                    self.udp_input_live[channel_name] = True
+                    self.master.after(0, self._schedule_refresh, True)
+                elif since_last < UDP_TIMESTAMP_MIN_INTERVAL:
+                    continue # Timestamp is still fresh; skip the dict write and debug log for this wakeup
+                self.udp_packet_timestamps[channel_name] = now
+                self.logger.debug(f"[{channel_name}] Received {packets_read} UDP packet(s). Timestamp updated.")
 
 
     def _monitor_ffmpeg_stderr(self, proc, channel_name):
         """
-        Monitors the stderr of an FFmpeg process for critical startup errors.
+        Monitors the stderr of an FFmpeg process for critical startup errors (thread version, used on Windows).
         This is primarily for initial connection/configuration issues.
         """
         self.logger.debug(f"[{channel_name}] Started stderr monitoring thread.")
         try:
-            # Read the first line to check for version info
-            first_line = proc.stderr.readline().decode('utf-8', errors='ignore').strip()
-            if first_line and "ffmpeg version" not in first_line:
-                self.logger.error(f"[{channel_name}][FFmpeg stderr] {first_line}. Setting status to unavailable.")
-                self.master.after(0, self._set_input_stream_status, channel_name, "unavailable")
-                return # Exit if it's a critical non-version error
-            
-            # Continue reading for other errors for a short period
-            # Use a non-blocking read with a small timeout to avoid hanging
-            start_time = time.time()
-            while time.time() - start_time < 5: # Read stderr for 5 seconds
-                line = proc.stderr.readline()
-                if not line:
-                    break # EOF
-                decoded_line = line.decode('utf-8', errors='ignore').strip()
-                if decoded_line:
-                    self.logger.error(f"[{channel_name}][FFmpeg stderr] {decoded_line}")
-                    # Add specific error patterns here if you want to react immediately
-                    if any(pattern.search(decoded_line) for pattern in [
-                        re.compile(r'Input/output error', re.IGNORECASE),
-                        re.compile(r'No such file or directory', re.IGNORECASE),
-                        re.compile(r'Connection refused', re.IGNORECASE),
-                        re.compile(r'Network is unreachable', re.IGNORECASE),
-                        re.compile(r'Failed to open', re.IGNORECASE),
-                        re.compile(r'Protocol not found', re.IGNORECASE),
-                        re.compile(r'Permission denied', re.IGNORECASE), # e.g., binding to an address without permission
-                        re.compile(r'Invalid data found when processing input', re.IGNORECASE)
-                    ]):
-                        self.logger.error(f"[{channel_name}] Remedy: FFmpeg reported a critical input error. Check input URL/IP/Port, network connectivity, and file permissions.")
-                        self.master.after(0, self._set_input_stream_status, channel_name, "unavailable")
-                        break # Stop monitoring after a critical error
-                time.sleep(0.01) # Small delay
+            # Read stderr for FFMPEG_STDERR_WATCH_SECONDS; the deadline also bounds a blocked read on a quiet FFmpeg
+            stderr_lines = iter_stderr_lines(proc.stderr, deadline=time.monotonic() + FFMPEG_STDERR_WATCH_SECONDS)
+            first_line = True
+            for line in stderr_lines: # Ends on EOF or at the watch deadline
+                if self._check_ffmpeg_stderr_line(channel_name, line, first_line):
+                    break # Stop monitoring after a critical error
+                first_line = False
         except Exception as e:
             self.logger.error(f"[{channel_name}] Error in stderr monitoring: {e}")
         finally:
             if proc.stderr:
                 proc.stderr.close()
             self.logger.debug(f"[{channel_name}] Stderr monitoring thread finished.")
-    
+
+    def _check_ffmpeg_stderr_line(self, channel_name, line, first_line):
+        """Logs one FFmpeg stderr line and flags critical errors. Returns True if monitoring should stop."""
+        if first_line:
+            # Check the first line for version info
+            if b"ffmpeg version" not in line:
+                self.logger.error(f"[{channel_name}][FFmpeg stderr] {line.decode('utf-8', errors='ignore')}. Setting status to unavailable.")
+                self.master.after(0, self._set_input_stream_status, channel_name, "unavailable")
+                return True # Exit if it's a critical non-version error
+            return False
+        self.logger.error(f"[{channel_name}][FFmpeg stderr] {line.decode('utf-8', errors='ignore')}")
+        # Add specific error patterns to FFMPEG_FATAL_ERROR_RE if you want to react immediately
+        if FFMPEG_FATAL_ERROR_RE.search(line):
+            self.logger.error(f"[{channel_name}] Remedy: FFmpeg reported a critical input error. Check input URL/IP/Port, network connectivity, and file permissions.")
+            self.master.after(0, self._set_input_stream_status, channel_name, "unavailable")
+            return True
+        return False
+
+    def _watch_ffmpeg_stderr(self, proc, channel_name):
+        """Hands an FFmpeg process's stderr pipe to the stderr watch thread (POSIX). Returns the new StderrWatch."""
+        os.set_blocking(proc.stderr.fileno(), False)
+        watch = StderrWatch(channel_name, proc, time.monotonic() + FFMPEG_STDERR_WATCH_SECONDS, b"", True)
+        self._stderr_pending.append(watch)
+        try:
+            self._stderr_wakeup_w.send(b'\0')
+        except (BlockingIOError, OSError):
+            pass # A wakeup is already pending
+        return watch
+
+    def _stderr_watch_thread(self):
+        """
+        A single background thread that scans the startup stderr of every FFmpeg process through one selector.
+        Each pipe is read as data arrives and dropped on EOF, on a critical error or at its watch deadline.
+        """
+        self.logger.debug("FFmpeg stderr watch thread started.")
+        watches = {} # {fd: StderrWatch}
+        while not self._stderr_watch_stop.is_set():
+            while self._stderr_pending:
+                watch = self._stderr_pending.popleft()
+                fd = watch.proc.stderr.fileno()
+                watches[fd] = watch
+                self._stderr_selector.register(fd, selectors.EVENT_READ, data=watch)
+                self.logger.debug(f"[{watch.channel_name}] Started stderr monitoring.")
+
+            timeout = max(0, min(w.deadline for w in watches.values()) - time.monotonic()) if watches else None
+            try:
+                events = self._stderr_selector.select(timeout=timeout)
+            except Exception as e:
+                if self._stderr_watch_stop.is_set():
+                    break # Selector closed during shutdown
+                self.logger.error(f"Stderr watch select error: {e}")
+                time.sleep(0.5)
+                continue
+            if self._stderr_watch_stop.is_set():
+                break
+
+            for key, _ in events:
+                watch = key.data
+                if watch is None:
+                    try:
+                        while key.fileobj.recv(4096):
+                            pass # Discard queued wakeup bytes
+                    except OSError:
+                        pass # Drained
+                    continue
+                try:
+                    data = os.read(key.fd, 65536)
+                except BlockingIOError:
+                    continue # Spurious readiness
+                except OSError as e:
+                    self.logger.error(f"[{watch.channel_name}] Error in stderr monitoring: {e}")
+                    data = b""
+                # On EOF, a closing newline flushes the incomplete last line
+                lines, watch.tail = split_stderr_chunk(watch.tail, data or b"\n")
+                done = not data
+                try:
+                    for line in lines:
+                        if self._check_ffmpeg_stderr_line(watch.channel_name, line, watch.first_line):
+                            done = True # Stop monitoring after a critical error
+                            break
+                        watch.first_line = False
+                except Exception as e: # Keep one bad pipe from stopping the watch for every stream
+                    self.logger.error(f"[{watch.channel_name}] Error in stderr monitoring: {e}")
+                    done = True
+                if done:
+                    self._end_stderr_watch(watches.pop(key.fd))
+
+            now = time.monotonic()
+            for fd in [fd for fd, w in watches.items() if now >= w.deadline]:
+                self._end_stderr_watch(watches.pop(fd))
+        for watch in watches.values(): # Shutting down: release the pipes still being watched
+            self._end_stderr_watch(watch)
+
+    def _end_stderr_watch(self, watch):
+        """Unregisters and closes a watched stderr pipe (stderr watch thread only)."""
+        try:
+            self._stderr_selector.unregister(watch.proc.stderr.fileno())
+        except (KeyError, ValueError):
+            pass
+        watch.proc.stderr.close()
+        self.logger.debug(f"[{watch.channel_name}] Stderr monitoring finished.")
+
 
     def _monitor_ffmpeg_processes(self):
         """
-        Global thread that periodically checks if FFmpeg processes are still running.
+        Global thread that reacts to FFmpeg process exits.
+        It sleeps until a child exits: on Linux via the children's pidfds, on other POSIX systems via SIGCHLD,
+        on Windows via the exit queue fed by monitor_process threads. There is no polling interval.
         If a process unexpectedly exits, it logs the event and updates the status.
         No automatic restarts are triggered by this monitor.
         """
         self.logger.info("Started global FFmpeg process monitor.")
-        while True:
-            for channel_name in list(self.processes.keys()): # Iterate over a copy
-                proc = self.processes.get(channel_name)
-                if proc and proc.poll() is not None: # Process has exited
-                    if not self.stream_stop_requested.get(channel_name, False):
-                        self.logger.error(f"[{channel_name}] ALARM: FFmpeg process unexpectedly exited (Return Code: {proc.returncode}).")
-                        self.logger.error(f"[{channel_name}] Remedy: Stream process crashed. Check FFmpeg logs for errors. This could be due to invalid input, resource exhaustion, or FFmpeg command issues.")
-                        self.master.after(0, self._set_input_stream_status, channel_name, "unavailable") # Set red status
-                    else:
-                        self.logger.info(f"[{channel_name}] FFmpeg process exited as requested by user.")
-                        self.master.after(0, self._set_input_stream_status, channel_name, "unknown") # Reset to grey
-                    
-                    # Clean up process reference
-                    if channel_name in self.processes:
-                        del self.processes[channel_name]
-                    self.master.after(0, self.update_ui_for_channel) # Update UI
-                    self.stream_stop_requested[channel_name] = False # Clear the flag
-            
-            time.sleep(self.app_config["ffmpeg_process_monitor_interval_seconds"])
+        while not self._proc_monitor_stop.is_set():
+            if self._proc_selector is not None:
+                exited = self._wait_for_child_exits()
+            else:
+                with self._child_exit_cv:
+                    while not self._child_exits and not self._proc_monitor_stop.is_set():
+                        self._child_exit_cv.wait()
+                exited = self._drain_child_exits()
+            if self._proc_monitor_stop.is_set():
+                break # Closing; on_closing has already terminated every process
+            for channel_name, proc in exited:
+                self._handle_child_exit(channel_name, proc)
+
+    def _handle_child_exit(self, channel_name, proc):
+        """Updates status and cleans up after an exited FFmpeg process, unless the channel has moved on to another process."""
+        if self.processes.get(channel_name) is not proc:
+            return # Already removed by stop_stream_internal, or replaced by a newer start
+        if not self.stream_stop_requested.get(channel_name, False):
+            self.logger.error(f"[{channel_name}] ALARM: FFmpeg process unexpectedly exited (Return Code: {proc.returncode}).")
+            self.logger.error(f"[{channel_name}] Remedy: Stream process crashed. Check FFmpeg logs for errors. This could be due to invalid input, resource exhaustion, or FFmpeg command issues.")
+            self.master.after(0, self._set_input_stream_status, channel_name, "unavailable") # Set red status
+        else:
+            self.logger.info(f"[{channel_name}] FFmpeg process exited as requested by user.")
+            self.master.after(0, self._set_input_stream_status, channel_name, "unknown") # Reset to grey
+
+        # Clean up process reference
+        del self.processes[channel_name]
+        self.stderr_monitors.pop(channel_name, None)
+        self._release_udp_input(channel_name)
+        self.master.after(0, self._schedule_refresh) # Update UI
+        self.stream_stop_requested[channel_name] = False # Clear the flag
+
+    def _watch_process_exit(self, proc, channel_name):
+        """
+        Arranges for proc's exit to wake the process monitor's selector: a registered pidfd on Linux,
+        SIGCHLD on other POSIX systems (the monitor then sweeps the process table with poll()).
+        Returns False if neither is available, in which case the caller starts a monitor_process thread.
+        """
+        if self._proc_selector is None:
+            return False
+        if self._sigchld_wakeup:
+            self._wake_process_monitor() # Catches a child that exited before it was added to self.processes
+            return True
+        if not PIDFD_SUPPORTED:
+            return False
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except OSError as e:
+            self.logger.warning(f"[{channel_name}] pidfd_open failed ({e}); watching the FFmpeg process with a wait thread.")
+            return False
+        self._proc_selector.register(pidfd, selectors.EVENT_READ, data=(channel_name, proc))
+        return True
+
+    def _wait_for_child_exits(self):
+        """
+        Blocks on the process selector until a child exits and returns the exited (channel_name, proc) pairs.
+        pidfd-watched children are reaped here; a SIGCHLD wakeup sweeps the process table instead.
+        """
+        try:
+            events = self._proc_selector.select()
+        except Exception as e:
+            if self._proc_monitor_stop.is_set():
+                return [] # Selector closed during shutdown
+            self.logger.error(f"Process monitor select error: {e}")
+            time.sleep(1)
+            return []
+        if self._proc_monitor_stop.is_set():
+            return [] # Woken for shutdown; on_closing releases the pidfds
+        exited = []
+        for key, _ in events:
+            if key.data is None:
+                try:
+                    while key.fileobj.recv(4096):
+                        pass # Discard queued wakeup bytes
+                except OSError:
+                    pass # Drained
+                if self._sigchld_wakeup:
+                    exited.extend((name, proc) for name, proc in list(self.processes.items()) if proc.poll() is not None)
+                continue
+            channel_name, proc = key.data
+            self._proc_selector.unregister(key.fd)
+            os.close(key.fd)
+            proc.wait() # Already exited, so this only reaps it and records returncode
+            self.logger.debug(f"FFmpeg process for '{channel_name}' finished monitoring. Return code: {proc.returncode}.")
+            exited.append((channel_name, proc))
+        exited.extend(self._drain_child_exits()) # From fallback monitor_process threads
+        return exited
+
+    def _drain_child_exits(self):
+        """Pops every (channel_name, proc) pair queued by monitor_process threads."""
+        exited = []
+        while self._child_exits:
+            exited.append(self._child_exits.popleft())
+        return exited
+
+    def _signal_child_exit(self, channel_name, proc):
+        """Queues an exit seen by a monitor_process thread and wakes the process monitor."""
+        self._child_exits.append((channel_name, proc))
+        with self._child_exit_cv:
+            self._child_exit_cv.notify_all()
+        self._wake_process_monitor()
+
+    def _wake_process_monitor(self):
+        """Interrupts the process monitor's blocking select(), if it uses one."""
+        if self._proc_selector is not None:
+            try:
+                self._proc_wakeup_w.send(b'\0')
+            except (BlockingIOError, OSError):
+                pass # A wakeup is already pending
 
     def _refresh_all_stream_statuses(self):
         """
@@ -1677,13 +2408,27 @@ class FFmpegStreamerApp:
         This function now provides more reliable status by checking both FFmpeg process state
         and UDP packet flow for UDP inputs.
         This function is called periodically and on manual refresh.
+        It only reads in-memory state (process table, reactor timestamps) and does no I/O,
+        so it runs directly on the Tk thread; all probing happens on the UDP reactor thread.
         """
         self.logger.debug("Refreshing all stream statuses...")
-        current_time = time.time()
+        current_time = time.monotonic() # udp_packet_timestamps are monotonic
+        # Loop invariants, read once per sweep instead of once per channel
+        udp_timeout = self.app_config["udp_packet_timeout_seconds"]
+        processes = self.processes
+        udp_listeners = self.udp_listeners
+        udp_packet_timestamps = self.udp_packet_timestamps
+        log_debug = self.logger.isEnabledFor(logging.DEBUG) # Skip building per-channel debug messages when unused
+        self._swept_gen = self._state_gen
+        next_stale_deadline = float('inf')
 
         for channel_name, channel_data in list(self.channels.items()):
             config = channel_data["config"]
-            is_streaming = channel_name in self.processes # Is FFmpeg process running?
+            is_streaming = channel_name in processes # Is FFmpeg process running?
+            is_udp = config["input_type"] == "UDP"
+            last_udp_packet_time = udp_packet_timestamps.get(channel_name) if is_udp else None
+            if last_udp_packet_time is not None and (current_time - last_udp_packet_time) <= udp_timeout:
+                next_stale_deadline = min(next_stale_deadline, last_udp_packet_time + udp_timeout)
             
             new_status = "unknown" # Default status for non-streaming channels
 
@@ -1691,10 +2436,9 @@ class FFmpegStreamerApp:
                 # If FFmpeg process is running, the channel is "streaming" (green)
                 # unless its input is UDP and packet loss is detected.
                 input_is_healthy = True
-                if config["input_type"] == "UDP":
-                    if channel_name in self.udp_packet_timestamps:
-                        last_udp_packet_time = self.udp_packet_timestamps[channel_name]
-                        if (current_time - last_udp_packet_time) > self.app_config["udp_packet_timeout_seconds"]:
+                if is_udp:
+                    if last_udp_packet_time is not None:
+                        if (current_time - last_udp_packet_time) > udp_timeout:
                             input_is_healthy = False
                             self.logger.warning(f"[{channel_name}] UDP input packet loss detected for running stream. Input deemed unhealthy.")
                             # self.logger.warning(f"[{channel_name}] Remedy: Check UDP source, network path, and firewall settings to ensure packets are reaching {config['input_ip']}:{config['input_port']}.")
@@ -1714,18 +2458,19 @@ class FFmpegStreamerApp:
                 # If not streaming, check special states first
                 if channel_data["input_stream_status"] == "scanning":
                     new_status = "scanning" # Keep scanning status if ffprobe is running
-                elif config["input_type"] == "UDP":
-                    if channel_name in self.udp_listener_threads and self.udp_listener_threads[channel_name].is_alive():
+                elif is_udp:
+                    if channel_name in udp_listeners:
                         # UDP listener is active, check if packets are coming in
-                        if channel_name in self.udp_packet_timestamps and \
-                           (current_time - self.udp_packet_timestamps[channel_name]) <= self.app_config["udp_packet_timeout_seconds"]:
+                        if last_udp_packet_time is not None and (current_time - last_udp_packet_time) <= udp_timeout:
                             new_status = "available" # Yellow (input present, ready to stream)
                         else:
                             new_status = "starting" # Blue (listener active, but no recent packets yet or just started)
-                            self.logger.debug(f"[{channel_name}] UDP listener active but no recent packets. Status 'starting'.")
+                            if log_debug:
+                                self.logger.debug(f"[{channel_name}] UDP listener active but no recent packets. Status 'starting'.")
                     else: # UDP listener not running or not yet started for this channel
                         new_status = "unknown" # Grey
-                        self.logger.debug(f"[{channel_name}] UDP listener not active. Status 'unknown'.")
+                        if log_debug:
+                            self.logger.debug(f"[{channel_name}] UDP listener not active. Status 'unknown'.")
                 else: # Non-UDP input types
                     # For non-UDP types not streaming, assume 'available' if a URL is configured, else 'unknown'
                     if self.get_input_url(config):
@@ -1734,21 +2479,21 @@ class FFmpegStreamerApp:
                         new_status = "unknown" # Grey
 
             # Update the status only if it's different to avoid unnecessary UI updates
-            if self.channels[channel_name]["input_stream_status"] != new_status:
-                self.logger.info(f"[{channel_name}] Status changed from '{self.channels[channel_name]['input_stream_status']}' to '{new_status}'.")
-                self.channels[channel_name]["input_stream_status"] = new_status
-                # Trigger UI update after status change
-                self.master.after(0, self.update_ui_for_channel)
-                self.master.after(0, self.update_status_indicators) # Ensure indicators are updated
-            else:
+            old_status = channel_data["input_stream_status"]
+            if old_status != new_status:
+                self.logger.info(f"[{channel_name}] Status changed from '{old_status}' to '{new_status}'.")
+                self._set_input_stream_status(channel_name, new_status) # Schedules the coalesced UI redraw
+            elif log_debug:
                 self.logger.debug(f"[{channel_name}] Status remains '{new_status}'. No UI update needed.")
 
+        self._next_stale_deadline = next_stale_deadline
+
 
     def monitor_process(self, proc, channel_name):
         """
-        Monitors a running FFmpeg process. When it exits, logs the event
-        and cleans up process/log file references.
-        The `_monitor_ffmpeg_processes` thread will detect the exit and update status.
+        Monitors a running FFmpeg process. When it exits, logs the event,
+        cleans up process/log file references and wakes the `_monitor_ffmpeg_processes`
+        thread, which updates the status.
         """
         proc.wait() # Wait for the process to terminate
         return_code = proc.returncode
@@ -1759,25 +2504,16 @@ class FFmpegStreamerApp:
         if channel_name in self.stderr_monitors:
             del self.stderr_monitors[channel_name]
         
-        # The _monitor_ffmpeg_processes thread will detect the process exit and handle status updates.
+        # Push the exit to the _monitor_ffmpeg_processes thread, which handles status updates.
         # No direct UI update or restart call here to avoid race conditions.
+        self._signal_child_exit(channel_name, proc)
 
     def start_stream_internal(self, channel_name):
         """Internal method to start a stream, used by auto-start logic on app launch."""
         self.logger.debug(f"Internal start stream requested for '{channel_name}'.")
-        # Temporarily set current_channel to the one being restarted if it's not already selected
-        original_current_channel = self.current_channel
-        if self.current_channel != channel_name:
-            self.current_channel = channel_name
-            self.load_channel_config() # Load config for the channel being restarted
-        
         self.logger.info(f"[{channel_name}] Auto-starting stream on app launch...")
-        self.start_stream() # Call the public start_stream method
-        
-        # Restore original current_channel if it was changed
-        if original_current_channel and original_current_channel != channel_name:
-            self.current_channel = original_current_channel
-            self.load_channel_config() # Reload config for the originally selected channel
+        # The channel's config is already in memory (and on disk), so there is no need to select it first
+        self._start_stream_for(channel_name)
 
     def stop_stream_internal(self, channel_name, user_initiated=True):
         """Internal method to stop a stream."""
@@ -1795,10 +2531,13 @@ class FFmpegStreamerApp:
         # Immediately remove from active processes and update UI for instant feedback
         if channel_name in self.processes:
             del self.processes[channel_name] 
-        self.master.after(0, self.update_ui_for_channel) # Force UI refresh
+        self._release_udp_input(channel_name)
+        # Recompute statuses too: _handle_child_exit skips this channel since it is already out of self.processes,
+        # so nothing else moves it off "streaming" before the next staleness sweep
+        self.master.after(0, self._schedule_refresh, True)
 
-        # Terminate the process in a separate thread to avoid blocking the GUI
-        threading.Thread(target=self._terminate_process_thread, args=(proc, channel_name)).start()
+        # Terminate the process on a pool worker to avoid blocking the GUI
+        self._term_pool.submit(self._terminate_process_thread, proc, channel_name)
 
 
     def stop_stream(self):
@@ -1817,8 +2556,9 @@ class FFmpegStreamerApp:
         try:
             # First, try to terminate gracefully
             proc.terminate()
-            proc.wait(timeout=5)
-            if proc.poll() is None:
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
                 # If still alive, send a stronger kill signal
                 self.logger.warning(f"FFmpeg process for '{channel_name}' did not terminate gracefully. Forcing kill.")
                 proc.kill()
@@ -1864,12 +2604,8 @@ class FFmpegStreamerApp:
                 self.logger.info(f"[{channel_name}] UDP input configuration changed. Restarting UDP listener and triggering re-scan.")
                 self._stop_udp_listener(self.current_channel) # Stop old listener if it was UDP
                 try:
-                    udp_ip = new_config['input_ip']
-                    udp_port = int(new_config['input_port'])
-                    bind_address = new_config['local_bind_interface']
-                    if bind_address == "Auto":
-                        bind_address = "0.0.0.0"
-                    self._start_udp_listener(self.current_channel, udp_ip, udp_port, bind_address)
+                    view = self._get_channel_view(self.current_channel)
+                    self._start_udp_listener(self.current_channel, view.input_ip, view.input_port, view.bind)
                 except ValueError:
                     self.logger.error(f"[{self.current_channel}] Invalid UDP port for listener on save: {new_config['input_port']}")
                     self._set_input_stream_status(self.current_channel, "unavailable")
@@ -1881,15 +2617,11 @@ class FFmpegStreamerApp:
             else:
                 self.logger.info(f"[{channel_name}] No significant UDP input configuration changes. Ensuring listener is active.")
                 # If UDP config didn't change, but listener might have been stopped (e.g., after preview)
-                if channel_name not in self.udp_listeners or not self.udp_listener_threads.get(channel_name, threading.Thread()).is_alive():
+                if channel_name not in self.udp_listeners:
                     try:
-                        udp_ip = new_config['input_ip']
-                        udp_port = int(new_config['input_port'])
-                        bind_address = new_config['local_bind_interface']
-                        if bind_address == "Auto":
-                            bind_address = "0.0.0.0"
+                        view = self._get_channel_view(self.current_channel)
                         self.logger.info(f"[{channel_name}] UDP listener was not active, restarting it after save.")
-                        self._start_udp_listener(self.current_channel, udp_ip, udp_port, bind_address)
+                        self._start_udp_listener(self.current_channel, view.input_ip, view.input_port, view.bind)
                     except Exception as e:
                         self.logger.error(f"[{channel_name}] Error ensuring UDP listener is active after save: {e}")
                         self._set_input_stream_status(self.current_channel, "unavailable")
@@ -1909,7 +2641,7 @@ class FFmpegStreamerApp:
             self.logger.debug(f"Input configuration changed for '{self.channels[self.current_channel]['display_name']}'. No scan needed for this input type.")
         
         # After saving, trigger a global refresh to update all statuses
-        self.master.after(0, self._refresh_all_stream_statuses)
+        self.master.after(0, self._schedule_refresh, True)
 
 
     def on_closing(self):
@@ -1919,33 +2651,88 @@ class FFmpegStreamerApp:
         for channel_name in list(self.channels.keys()):
             self.channels[channel_name]["last_known_streaming_state"] = channel_name in self.processes
         save_channels_config(self.channels)
+        if self._app_config_save_after_id is not None: # Superseded by the synchronous save below
+            self.master.after_cancel(self._app_config_save_after_id)
+            self._app_config_save_after_id = None
+        # Drop queued snapshots and let a write in progress finish, so no older snapshot lands after this save
+        self._app_config_save_pool.shutdown(wait=True, cancel_futures=True)
         save_app_config(self.app_config)
         self.logger.info("Channel and application configurations saved.")
 
-        # Terminate all running FFmpeg processes
+        # Terminate all running FFmpeg processes: signal every one first, then share a single 5 s grace window
         self.logger.info("Terminating all FFmpeg processes...")
-        for channel_name, proc in list(self.processes.items()): # Iterate over a copy
+        running = list(self.processes.items()) # Iterate over a copy
+        for channel_name, proc in running:
             try:
                 proc.terminate() # Send termination signal
-                proc.wait(timeout=5) # Give it some time to exit gracefully
-                if proc.poll() is None: # If still running, force kill
-                    proc.kill()
-                self.logger.info(f"FFmpeg process for '{channel_name}' terminated.")
             except Exception as e:
                 self.logger.error(f"Error terminating FFmpeg process for '{channel_name}': {e}")
+        deadline = time.monotonic() + 5 # Give them some time to exit gracefully, in parallel
+        for channel_name, proc in running:
+            try:
+                proc.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired: # Still running: force kill
+                self.logger.warning(f"FFmpeg process for '{channel_name}' did not terminate gracefully. Forcing kill.")
+                proc.kill()
+            except Exception as e:
+                self.logger.error(f"Error terminating FFmpeg process for '{channel_name}': {e}")
+                continue
+            self.logger.info(f"FFmpeg process for '{channel_name}' terminated.")
+        self._term_pool.shutdown(wait=True) # Let terminations of streams stopped just before closing finish
         
+        # Stop preview if running, before the UDP listeners go: a preview whose ffplay has already exited
+        # restarts its channel's listener right away, and that must still find an open selector
+        self.logger.info("Stopping any active preview...")
+        self._stop_preview_internal()
+        self._preview_pool.shutdown(wait=False, cancel_futures=True) # A running reap still finishes before exit
+
         # Stop and close all UDP listener sockets
         self.logger.info("Stopping all UDP listeners...")
         for channel_name in list(self.udp_listeners.keys()):
             self._stop_udp_listener(channel_name)
-
-        # Stop preview if running
-        self.logger.info("Stopping any active preview...")
-        self._stop_preview_internal()
+        self._udp_reactor_stop.set()
+        self._wake_udp_reactor()
+        self.udp_selector.close()
+        self._udp_wakeup_r.close()
+        self._udp_wakeup_w.close()
+
+        # Stop the process monitor, then release its selector, wakeup socketpair, pidfds and SIGCHLD wakeup
+        self._proc_monitor_stop.set()
+        with self._child_exit_cv:
+            self._child_exit_cv.notify_all()
+        if self._proc_selector is not None:
+            if self._sigchld_wakeup:
+                signal.set_wakeup_fd(-1)
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                self._sigchld_wakeup = False
+            self._wake_process_monitor()
+            self.process_monitor_thread.join(timeout=1) # So it is not mid-event when the pidfds are closed
+            for key in list(self._proc_selector.get_map().values()):
+                if key.data is not None:
+                    os.close(key.fd) # pidfd of a child still being watched
+            self._proc_selector.close()
+            self._proc_wakeup_r.close()
+            self._proc_wakeup_w.close()
+
+        # Stop the stderr watch thread (POSIX), then release its selector and wakeup socketpair
+        if self._stderr_selector is not None:
+            self._stderr_watch_stop.set()
+            try:
+                self._stderr_wakeup_w.send(b'\0')
+            except (BlockingIOError, OSError):
+                pass # A wakeup is already pending
+            self.stderr_watch_thread.join(timeout=1) # It closes the pipes it still watches on the way out
+            self._stderr_selector.close()
+            self._stderr_wakeup_r.close()
+            self._stderr_wakeup_w.close()
 
         self.master.destroy()
         self.logger.info("Application destroyed.")
 
+        # Flush any queued log records to the console/file handlers before exiting
+        if self.log_listener:
+            self.log_listener.stop()
+
     def scan_services(self, *args):
         """
         Initiates a scan for services/programs in the input UDP stream using ffprobe.
@@ -1966,8 +2753,7 @@ class FFmpegStreamerApp:
             self._set_input_stream_status(self.current_channel, "unavailable") # Set red status
             return
         
-        self.channels[self.current_channel]["input_stream_status"] = "scanning"
-        self.update_status_indicators()
+        self._set_input_stream_status(self.current_channel, "scanning")
         self.logger.info(f"Scanning {input_url} for services using ffprobe...")
         
         thread = threading.Thread(target=self._run_ffprobe, args=(input_url,))
@@ -1982,30 +2768,25 @@ class FFmpegStreamerApp:
         self.logger.debug(f"[{channel_name}] ffprobe thread started for {input_url}.")
         try:
             command = ['ffprobe', '-v', 'quiet', '-print_format', 'json', '-show_programs', '-show_streams', input_url] # Added -show_streams
-            # Prepare popen_kwargs for subprocess.run
-            popen_kwargs = {
-                'capture_output': True,
-                'text': True,
-                'check': True,
-                'timeout': 15
-            }
-            if os.name == 'nt': # Only add creationflags on Windows
-                popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-
-            result = subprocess.run(command, **popen_kwargs)
-            data = json.loads(result.stdout)
+            # Raw bytes: the JSON parser decodes UTF-8 itself, so no text-mode str copy is made first
+            result = subprocess.run(command, capture_output=True, check=True, timeout=15, **NO_WINDOW_KWARGS)
+            data = _loads_json(result.stdout)
             programs = data.get('programs', [])
             streams = data.get('streams', []) # Get global streams for programs without explicit stream info
             
             # Enrich programs with stream information if not already present
-            for p in programs:
-                if 'streams' not in p:
-                    # Attempt to find streams belonging to this program
-                    p['streams'] = [s for s in streams if s.get('program_id') == p['program_id']]
+            if any('streams' not in p for p in programs):
+                # Index streams by program once (O(P+S)) instead of rescanning every stream for each program
+                streams_by_program = collections.defaultdict(list)
+                for s in streams:
+                    streams_by_program[s.get('program_id')].append(s)
+                for p in programs:
+                    if 'streams' not in p:
+                        p['streams'] = streams_by_program.get(p['program_id'], [])
 
             self.master.after(0, self._update_programs_list, programs, channel_name)
         except subprocess.CalledProcessError as e:
-            self.logger.error(f"[{channel_name}] ffprobe failed: {e.stderr.strip()}")
+            self.logger.error(f"[{channel_name}] ffprobe failed: {e.stderr.decode('utf-8', errors='ignore').strip()}")
             self.logger.error(f"[{channel_name}] Remedy: ffprobe could not analyze the input. Check input URL/IP/Port, ensure the stream is active, and FFmpeg/ffprobe are correctly installed.")
             self.master.after(0, self._set_input_stream_status, channel_name, "unavailable")
         except json.JSONDecodeError as e:
@@ -2033,69 +2814,73 @@ class FFmpegStreamerApp:
         if not programs:
             self.logger.info(f"[{channel_name}] No services/programs found in the stream.")
             if channel_name == self.current_channel:
-                self.program_id_combo['values'] = []
+                self._set_program_combo_values(())
                 self.program_id_var.set("No services found")
             self._set_input_stream_status(channel_name, "unavailable")
             self.channels[channel_name]["has_any_video_stream_detected"] = False # No programs, so no video
+            self._program_has_video.pop(channel_name, None)
             return
         
         self.logger.info(f"[{channel_name}] Found {len(programs)} services.")
         self.channels[channel_name]["programs"] = programs
         
         display_list = []
+        id_to_index = {} # {program_id (str): index in display_list}, for O(1) selection restore
+        video_by_id = {} # {program_id (str): has video stream}, for the input preview check
         has_any_video_stream = False
         for p in programs:
             program_id = p['program_id']
             service_name = p['tags'].get('service_name', 'Unknown')
             
             # Check if the program has any video streams
-            program_has_video = any(stream.get('codec_type') == 'video' for stream in p.get('streams', []))
+            program_has_video = any(stream.get('codec_type') == 'video' for stream in p.get('streams', ()))
             
             if program_has_video:
                 display_list.append(f"{service_name} (ID: {program_id}) [Video]")
                 has_any_video_stream = True
             else:
                 display_list.append(f"{service_name} (ID: {program_id}) [No Video]")
+            id_to_index.setdefault(str(program_id), len(display_list) - 1)
+            video_by_id.setdefault(str(program_id), program_has_video)
         
         self.channels[channel_name]["has_any_video_stream_detected"] = has_any_video_stream
+        self._program_has_video[channel_name] = video_by_id
         
         if channel_name == self.current_channel:
-            self.program_id_combo['values'] = display_list
+            self._set_program_combo_values(display_list)
             config = self.channels[channel_name]["config"] # Get config to load saved program_id
             selected_program_id = config.get("program_id") # Get saved program_id
             if selected_program_id:
-                found = False
-                for i, item in enumerate(display_list):
-                    if f"(ID: {selected_program_id})" in item:
-                        self.program_id_combo.current(i)
-                        found = True
-                        break
-                    if not found and display_list: # If previously selected ID not found, but other options exist
-                        self.program_id_combo.current(0) # Select first available
-                        self.logger.warning(f"[{channel_name}] Previously selected program ID {selected_program_id} not found. Selecting first available.")
-                if not found: # If no options at all, or previously selected not found and no other options
+                idx = id_to_index.get(str(selected_program_id))
+                if idx is not None:
+                    self._select_program_combo_index(idx)
+                elif display_list: # If previously selected ID not found, but other options exist
+                    self._select_program_combo_index(0) # Select first available
+                    self.logger.warning(f"[{channel_name}] Previously selected program ID {selected_program_id} not found. Selecting first available.")
+                else: # If no options at all
                     self.program_id_combo.set("No services found")
             elif display_list:
-                self.program_id_combo.current(0) # Select first if no previous selection
+                self._select_program_combo_index(0) # Select first if no previous selection
             else:
                 self.program_id_var.set("No services found")
         
         self._set_input_stream_status(channel_name, "available")
-        self.master.after(0, self._refresh_all_stream_statuses) # Trigger a global refresh after scan
+        self.master.after(0, self._schedule_refresh, True) # Trigger a global refresh after scan
 
     def _set_input_stream_status(self, channel_name, status):
         """Helper function to update a channel's input stream status and trigger UI refresh."""
-        if channel_name in self.channels:
-            # Only update if the status is actually changing to avoid unnecessary UI redraws
-            if self.channels[channel_name]["input_stream_status"] != status:
-                self.logger.debug(f"[{channel_name}] Setting input stream status to: {status}")
-                self.channels[channel_name]["input_stream_status"] = status
-                # Call update_status_indicators to update visual elements (colors)
-                self.master.after(0, self.update_status_indicators)
-                # Call update_ui_for_channel to re-evaluate button states (e.g., preview button)
-                self.master.after(0, self.update_ui_for_channel)
-            else:
-                self.logger.debug(f"[{channel_name}] Status already '{status}'. No change needed.")
+        channel_data = self.channels.get(channel_name)
+        # Only update if the status is actually changing; repeats schedule no refresh at all
+        if channel_data is None or channel_data["input_stream_status"] == status:
+            return
+        self.logger.debug(f"[{channel_name}] Setting input stream status to: {status}")
+        channel_data["input_stream_status"] = status
+        self._state_gen += 1
+        if status == "unavailable":
+            # The cached stream URL may be what failed; resolve it again on the next start
+            self._yt_url_cache.pop(channel_data["config"].get("input_url"), None)
+        # A status actually flipped; redraw once the current burst of changes has settled
+        self._schedule_refresh()
 
     # --- Preview Functions (using ffplay) ---
     def toggle_preview(self, preview_type):
@@ -2120,8 +2905,10 @@ class FFmpegStreamerApp:
 
     def _start_preview_internal(self, preview_type):
         """Internal method to start the ffplay preview for the specified type."""
-        config = self.channels.get(self.current_channel, {}).get("config", {})
         channel_name = self.current_channel # Capture for use in threads
+        channel = self.channels.get(channel_name, {})
+        config = channel.get("config", {})
+        display_name = channel.get("display_name", channel_name)
 
         if preview_type == "input":
             source_url = self.get_input_url(config)
@@ -2140,17 +2927,14 @@ class FFmpegStreamerApp:
                 selected_program_id = config.get("program_id")
                 has_video_in_selected_program = False
                 if selected_program_id:
-                    for p in self.channels[self.current_channel].get("programs", []):
-                        if str(p['program_id']) == selected_program_id:
-                            has_video_in_selected_program = any(stream.get('codec_type') == 'video' for stream in p.get('streams', []))
-                            break
-                elif not selected_program_id and self.channels[self.current_channel]["programs"]:
+                    has_video_in_selected_program = self._program_has_video.get(channel_name, {}).get(selected_program_id, False)
+                elif not selected_program_id and channel.get("programs"):
                     # If no program selected, but programs exist, check if *any* has video
-                    has_video_in_selected_program = self.channels[self.current_channel].get("has_any_video_stream_detected", False)
+                    has_video_in_selected_program = channel.get("has_any_video_stream_detected", False)
 
                 if not has_video_in_selected_program:
                     messagebox.showwarning("No Video Stream Detected",
-                                           f"The selected input stream for '{self.channels[self.current_channel]['display_name']}' "
+                                           f"The selected input stream for '{display_name}' "
                                            "does not appear to contain a video stream, or no program with video was selected.\n"
                                            "The preview window might appear blank or only play audio if available.")
                     self.logger.warning(f"[{channel_name}] Input preview started without detected video stream in selected program.")
@@ -2165,25 +2949,19 @@ class FFmpegStreamerApp:
 
         if not source_url:
             messagebox.showerror("Preview Error", f"{message_prefix} URL/IP/Port is not configured for the selected channel.")
-            self.logger.error(f"[{self.current_channel}] No valid {message_prefix.lower()} source configured for preview.")
+            self.logger.error(f"[{channel_name}] No valid {message_prefix.lower()} source configured for preview.")
             return
 
-        self.logger.info(f"Starting ffplay preview for {self.current_channel} ({message_prefix}) from {source_url}")
+        self.logger.info(f"Starting ffplay preview for {channel_name} ({message_prefix}) from {source_url}")
         
-        ffplay_command = [
-            "ffplay",
-            "-window_title", f"Live Preview: {self.channels[self.current_channel]['display_name']} ({title_suffix})",
-            "-i", source_url,
-            "-autoexit", # Auto-exit when stream ends or is interrupted
-            "-x", "640", "-y", "360" # Set initial window size
-        ]
+        ffplay_command = ["ffplay", "-window_title", f"Live Preview: {display_name} ({title_suffix})", "-i", source_url, *FFPLAY_WINDOW_ARGS]
 
         # Add global input options to ffplay for input preview
         if preview_type == "input":
-            if config.get('input_analyzeduration') and config['input_analyzeduration'] != "0":
-                ffplay_command.extend(['-analyzeduration', config['input_analyzeduration']])
-            if config.get('input_probesize') and config['input_probesize'] != "0":
-                ffplay_command.extend(['-probesize', config['input_probesize']])
+            for flag, key in FFPLAY_INPUT_PROBE_OPTIONS:
+                value = config.get(key)
+                if value and value != "0":
+                    ffplay_command += (flag, value)
             # Removed -map 0:p:PROGRAM_ID for ffplay as it causes "Option not found" error
             # ffplay_command.extend(['-map', f"0:v:0?", '-map', '0:a:0?']) # Use optional mapping for video/audio
         
@@ -2193,36 +2971,32 @@ class FFmpegStreamerApp:
         if preview_type == "output" and config['output_type'] == "RTP":
             ffplay_command.extend(['-rtp_payload_type', config.get('output_rtp_payload_type', '96')])
 
-        # Conditionally add creation_flags only on Windows
-        popen_kwargs = {
-            'stdout': subprocess.DEVNULL, # Keep DEVNULL unless we suspect stdout is the issue
-            'stderr': subprocess.PIPE
-        }
-        if os.name == 'nt':
-            popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
-
         try:
             # Terminate any existing ffplay process first
             self._stop_preview_internal() # Ensure previous preview is fully stopped
 
-            self.ffplay_process = subprocess.Popen(ffplay_command, **popen_kwargs)
+            self.ffplay_process = subprocess.Popen(ffplay_command, **STREAM_POPEN_KWARGS)
             self.logger.debug(f"[{channel_name}] ffplay process started with PID: {self.ffplay_process.pid}")
             self.logger.debug(f"[{channel_name}] ffplay process poll() immediately after Popen: {self.ffplay_process.poll()}")
-            
-            time.sleep(0.1) # Small delay to allow window creation
 
+            # Marked running right away (no sleep for window creation), so a second click stops this ffplay
+            # instead of starting another; an instant exit is noticed when the stderr poll reaches EOF
             self.preview_running = True
             self.current_preview_type = preview_type # Store the current preview type
             
             # Start stderr monitoring for ffplay
-            self.ffplay_stderr_monitor = threading.Thread(target=self._monitor_ffplay_stderr, args=(self.ffplay_process, self.current_channel))
-            self.ffplay_stderr_monitor.daemon = True
-            self.ffplay_stderr_monitor.start()
+            if os.name != 'nt':
+                # POSIX pipes can be read non-blocking, so the Tk loop drains them without a thread
+                os.set_blocking(self.ffplay_process.stderr.fileno(), False)
+                self.logger.debug(f"[{channel_name}][FFplay stderr monitor] Started.")
+                self.ffplay_stderr_poll_id = self.master.after(FFPLAY_STDERR_POLL_MS, self._poll_ffplay_stderr, self.ffplay_process, channel_name, b"", False)
+            else:
+                self.ffplay_stderr_monitor = self._preview_pool.submit(self._monitor_ffplay_stderr, self.ffplay_process, channel_name)
 
-            self.master.after(0, self.update_ui_for_channel) # Update button states
+            self.master.after(0, self._schedule_refresh) # Update button states
 
             # Schedule auto-stop after the configured time
-            self.preview_auto_stop_id = self.master.after(self.app_config['preview_auto_stop_seconds'] * 1000, self._stop_preview_internal)
+            self.preview_auto_stop_id = self.master.after(self._preview_auto_stop_ms, self._stop_preview_internal)
 
         except FileNotFoundError:
             messagebox.showerror("Error", "ffplay executable not found. Please ensure FFmpeg is installed and in your PATH.")
@@ -2233,20 +3007,59 @@ class FFmpegStreamerApp:
             self.logger.error(f"Failed to start ffplay preview: {e}. Remedy: Check ffplay command syntax, input/output URLs, and ensure no other process is using the preview port.")
             self._stop_preview_internal() # Ensure state is reset
 
+    def _poll_ffplay_stderr(self, proc, channel_name, tail, video_started):
+        """
+        Drains one chunk of ffplay's non-blocking stderr on the Tk thread and reschedules itself until EOF.
+        Lines are only split and logged until video frames are detected, or for as long as debug logging is on.
+        """
+        self.ffplay_stderr_poll_id = None
+        try:
+            data = os.read(proc.stderr.fileno(), 65536)
+        except BlockingIOError:
+            data = None # Nothing new this tick
+        except (OSError, ValueError) as e: # ValueError: the pipe was closed by _stop_preview_internal
+            self.logger.error(f"[{channel_name}][FFplay stderr monitor] Error reading stderr: {e}")
+            return
+        log_debug = self.logger.isEnabledFor(logging.DEBUG)
+        if data is not None and (log_debug or not video_started):
+            lines, tail = split_stderr_chunk(tail, data or b"\n") # At EOF, flush the partial last line
+            debug, frame_search = self.logger.debug, FFMPEG_FRAME_RE.search # Bound once for the per-line loop
+            for line in lines:
+                if log_debug:
+                    debug(f"[{channel_name}][FFplay stderr] {line.decode('utf-8', errors='ignore')}")
+                if not video_started and frame_search(line):
+                    video_started = True
+                    self.logger.info(f"[{channel_name}] ffplay: Video frames detected. Displaying video.")
+        if data == b"":
+            proc.stderr.close()
+            self.logger.debug(f"[{channel_name}][FFplay stderr monitor] Finished.")
+            if proc is self.ffplay_process: # ffplay exited by itself (failed to open, window closed, -autoexit)
+                self.logger.info(f"[{channel_name}] ffplay exited. Resetting preview state.")
+                self._stop_preview_internal()
+            return
+        self.ffplay_stderr_poll_id = self.master.after(FFPLAY_STDERR_POLL_MS, self._poll_ffplay_stderr, proc, channel_name, tail, video_started)
+
     def _monitor_ffplay_stderr(self, proc, channel_name):
-        """Monitors the stderr of the ffplay process for error messages."""
+        """Monitors the stderr of the ffplay process for error messages (Windows, where pipes can't be read non-blocking)."""
         self.logger.debug(f"[{channel_name}][FFplay stderr monitor] Started.")
         # Flag to track if video frames have started
         video_started = False
+        log_debug = self.logger.isEnabledFor(logging.DEBUG) # Skip per-line decoding and log records when unused
+        debug, frame_search = self.logger.debug, FFMPEG_FRAME_RE.search # Bound once for the per-line loop
         try:
-            for line in iter(proc.stderr.readline, b''):
-                decoded_line = line.decode('utf-8', errors='ignore').strip()
-                if decoded_line:
-                    self.logger.debug(f"[{channel_name}][FFplay stderr] {decoded_line}") # Changed to debug for less clutter
-                    # Check for "frame=" to detect if video frames are being received
-                    if not video_started and "frame=" in decoded_line:
-                        video_started = True
-                        self.logger.info(f"[{channel_name}] ffplay: Video frames detected. Displaying video.")
+            for line in iter_stderr_lines(proc.stderr):
+                if log_debug:
+                    debug(f"[{channel_name}][FFplay stderr] {line.decode('utf-8', errors='ignore')}") # Changed to debug for less clutter
+                # Check for "frame=" to detect if video frames are being received
+                if not video_started and frame_search(line):
+                    video_started = True
+                    self.logger.info(f"[{channel_name}] ffplay: Video frames detected. Displaying video.")
+                    if not log_debug:
+                        break # Nothing left to look for
+            # Keep draining in large chunks without splitting lines, so ffplay never blocks on a full pipe
+            fd = proc.stderr.fileno()
+            while os.read(fd, 65536):
+                pass
         except Exception as e:
             self.logger.error(f"[{channel_name}][FFplay stderr monitor] Error reading stderr: {e}")
         finally:
@@ -2271,109 +3084,150 @@ class FFmpegStreamerApp:
             self.preview_auto_stop_id = None
             self.logger.debug("Cancelled preview auto-stop timer.")
 
-        if self.ffplay_process and self.ffplay_process.poll() is None:
+        # Stop draining ffplay's stderr from the Tk loop
+        if self.ffplay_stderr_poll_id:
+            self.master.after_cancel(self.ffplay_stderr_poll_id)
+            self.ffplay_stderr_poll_id = None
+
+        proc = self.ffplay_process
+        self.ffplay_process = None # Clear the reference
+        self.ffplay_stderr_monitor = None # The Windows reader task ends on its own at EOF
+        channel_name = self.current_channel # The listener to restart belongs to the channel being previewed now
+
+        self.logger.info("Preview stopped.")
+        self._schedule_refresh() # Update button states
+
+        if proc and proc.poll() is None:
             self.logger.info("Terminating ffplay preview process.")
             try:
-                self.ffplay_process.terminate()
-                self.ffplay_process.wait(timeout=2)
-                if self.ffplay_process.poll() is None:
-                    self.ffplay_process.kill()
+                proc.terminate() # Signal now; waiting for the exit happens off the Tk thread
             except Exception as e:
                 self.logger.error(f"Error terminating ffplay process: {e}")
-            self.ffplay_process = None # Clear the reference
-            
-        # Ensure stderr monitor thread is joined if it exists
-        if self.ffplay_stderr_monitor and self.ffplay_stderr_monitor.is_alive():
-            self.logger.debug("Joining ffplay stderr monitor thread.")
-            self.ffplay_stderr_monitor.join(timeout=1)
-            if self.ffplay_stderr_monitor.is_alive():
-                self.logger.warning("FFplay stderr monitor thread did not stop gracefully.")
-        self.ffplay_stderr_monitor = None # Clear the reference
+            reap = self._preview_pool.submit(self._reap_preview_thread, proc)
+            self.master.after(FFPLAY_STDERR_POLL_MS, self._poll_preview_reaped, reap, channel_name)
+            return
+        if proc and os.name != 'nt' and proc.stderr:
+            proc.stderr.close() # No poll is left to reach EOF
+        self._after_preview_stopped(channel_name)
 
-        self.logger.info("Preview stopped.")
-        self.update_ui_for_channel() # Update button states
+    def _reap_preview_thread(self, proc):
+        """Waits for a terminated ffplay to exit, killing it after 2 s (a _preview_pool task; see _poll_preview_reaped)."""
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self.logger.warning("ffplay did not terminate gracefully. Forcing kill.")
+            proc.kill()
+            proc.wait()
+        except Exception as e:
+            self.logger.error(f"Error terminating ffplay process: {e}")
+        if os.name != 'nt' and proc.stderr:
+            proc.stderr.close() # No poll is left to reach EOF
+
+    def _poll_preview_reaped(self, reap, channel_name):
+        """Checks on the Tk thread whether a _reap_preview_thread task is done, then restarts the freed UDP listener."""
+        if not reap.done():
+            self.master.after(FFPLAY_STDERR_POLL_MS, self._poll_preview_reaped, reap, channel_name)
+            return
+        self._after_preview_stopped(channel_name)
 
+    def _after_preview_stopped(self, channel_name):
+        """Restarts the channel's UDP listener once its preview's ffplay has exited, freeing the port."""
+        if self.preview_running and self.current_preview_type == "input" and self.current_channel == channel_name:
+            return # A new input preview took the port over in the meantime
         # Restart UDP listener if it was stopped for input preview
-        if self.current_channel and self.channels[self.current_channel]["config"]["input_type"] == "UDP":
-            config = self.channels[self.current_channel]["config"]
+        config = self.channels[channel_name]["config"] if channel_name in self.channels else None
+        if config and config["input_type"] == "UDP":
             try:
-                udp_ip = config['input_ip']
-                udp_port = int(config['input_port'])
-                bind_address = config['local_bind_interface']
-                if bind_address == "Auto":
-                    bind_address = "0.0.0.0"
-                self.logger.info(f"[{self.current_channel}] Restarting UDP listener after preview stopped.")
-                self._start_udp_listener(self.current_channel, udp_ip, udp_port, bind_address)
+                view = self._get_channel_view(channel_name)
+                self.logger.info(f"[{channel_name}] Restarting UDP listener after preview stopped.")
+                self._start_udp_listener(channel_name, view.input_ip, view.input_port, view.bind)
                 # After restarting, status will be determined by _refresh_all_stream_statuses
             except ValueError:
-                self.logger.error(f"[{self.current_channel}] Invalid UDP port for listener restart: {config['input_port']}. Listener may not restart correctly.")
+                self.logger.error(f"[{channel_name}] Invalid UDP port for listener restart: {config['input_port']}. Listener may not restart correctly.")
+            except Exception as e:
+                self.logger.error(f"[{channel_name}] Error restarting UDP listener after preview: {e}. Listener may not restart correctly.")
+
+    def _system_metrics_worker(self):
+        """
+        Background thread that samples CPU, RAM and network usage with psutil every SYSTEM_METRICS_INTERVAL_SECONDS
+        and hands each sample to the Tk thread, so a slow psutil call can never stall the UI loop.
+        """
+        ps = _psutil()
+        # Initialize psutil for network bytes
+        ps.net_io_counters.cache_clear()
+        last_net_io = ps.net_io_counters(pernic=False, nowrap=True) # Single read for both baselines
+        last_net_time = time.monotonic()
+        ps.cpu_percent(interval=None) # Prime the CPU counter; the first non-blocking reading is always 0.0
+        while True:
+            time.sleep(SYSTEM_METRICS_INTERVAL_SECONDS)
+            try:
+                cpu_percent = ps.cpu_percent(interval=None) # Non-blocking call
+                ram_percent = ps.virtual_memory().percent
+
+                # Network Usage (Bytes/second, then converted to Mbps); aggregate counters only (no per-NIC dicts),
+                # nowrap keeps deltas valid across counter overflow
+                current_net_io = ps.net_io_counters(pernic=False, nowrap=True)
+                current_time = time.monotonic() # Interval only; immune to wall-clock (NTP) steps
+                time_diff = current_time - last_net_time
+                net_speed_mbps = 0.0
+                if time_diff > 0:
+                    # Use the higher of upload/download for network utilization, converted to Mbps
+                    sent = current_net_io.bytes_sent - last_net_io.bytes_sent
+                    recv = current_net_io.bytes_recv - last_net_io.bytes_recv
+                    net_speed_mbps = (sent if sent > recv else recv) * BYTES_TO_MEGABITS / time_diff
+                last_net_io, last_net_time = current_net_io, current_time
             except Exception as e:
-                self.logger.error(f"[{self.current_channel}] Error restarting UDP listener after preview: {e}. Listener may not restart correctly.")
+                self.logger.error(f"System metrics sampling failed: {e}")
+                continue
+            try:
+                self.master.after(0, self._update_system_metrics, cpu_percent, ram_percent, net_speed_mbps)
+            except (RuntimeError, tk.TclError):
+                return # Main window is gone; the app is closing
 
-    def _update_system_metrics(self):
-        """Fetches and updates CPU, RAM, and Network usage in the UI."""
+    def _update_system_metrics(self, cpu_percent, ram_percent, net_speed_mbps):
+        """Updates the CPU, RAM, and Network meters in the UI from one sample taken by _system_metrics_worker."""
         # CPU Usage
-        cpu_percent = psutil.cpu_percent(interval=None) # Non-blocking call
-        self.cpu_pb['value'] = cpu_percent
-        self._set_progressbar_bootstyle(self.cpu_pb, cpu_percent)
-        self.cpu_pb_label.config(text=f"CPU: {cpu_percent:.1f}%")
+        self._set_meter("cpu", self.cpu_pb, self.cpu_pb_label, cpu_percent, f"CPU: {cpu_percent:.1f}%")
 
         # RAM Usage
-        ram_percent = psutil.virtual_memory().percent
-        self.ram_pb['value'] = ram_percent
-        self._set_progressbar_bootstyle(self.ram_pb, ram_percent)
-        self.ram_pb_label.config(text=f"RAM: {ram_percent:.1f}%")
-
-        # Network Usage (Bytes/second, then converted to Mbps for percentage)
-        current_net_io = psutil.net_io_counters()
-        current_time = time.time()
-
-        time_diff = current_time - self.last_net_time
-        if time_diff > 0:
-            bytes_sent_diff = current_net_io.bytes_sent - self.last_net_bytes_sent
-            bytes_recv_diff = current_net_io.bytes_recv - self.last_net_bytes_recv
-
-            # Convert bytes/second to Mbps
-            upload_speed_mbps = (bytes_sent_diff / time_diff) * 8 / (1024 * 1024)
-            download_speed_mbps = (bytes_recv_diff / time_diff) * 8 / (1024 * 1024)
-            
-            # Use the higher of upload/download for network utilization
-            current_net_speed_mbps = max(upload_speed_mbps, download_speed_mbps)
-            
-            network_max_mbps = self.app_config.get("network_max_bandwidth_mbps", 100) # Default to 100 Mbps
-            if network_max_mbps <= 0: # Prevent division by zero
-                network_utilization_percent = 0
-            else:
-                network_utilization_percent = (current_net_speed_mbps / network_max_mbps) * 100
-            
-            # Cap at 100%
-            network_utilization_percent = min(100, network_utilization_percent)
-
-            self.network_pb['value'] = network_utilization_percent
-            self._set_progressbar_bootstyle(self.network_pb, network_utilization_percent)
-            self.network_pb_label.config(text=f"NW: {current_net_speed_mbps:.1f}Mbps") # Changed label to Mbps
-
-        self.last_net_bytes_sent = current_net_io.bytes_sent
-        self.last_net_bytes_recv = current_net_io.bytes_recv
-        self.last_net_time = current_time
-
-        # Schedule the next update
-        self.master.after(2000, self._update_system_metrics) # Update every 2 seconds
-
-    def _set_progressbar_bootstyle(self, progressbar_widget, value):
-        """Sets the bootstyle of a Progressbar based on its value."""
+        self._set_meter("ram", self.ram_pb, self.ram_pb_label, ram_percent, f"RAM: {ram_percent:.1f}%")
+
+        # Network Usage
+        network_utilization_percent = net_speed_mbps * self._net_max_inv
+        if network_utilization_percent > 100: # Cap at 100%
+            network_utilization_percent = 100
+
+        self._set_meter("net", self.network_pb, self.network_pb_label, network_utilization_percent,
+                        f"NW: {net_speed_mbps:.1f}Mbps") # Changed label to Mbps
+
+    def _set_meter(self, meter_name, progressbar_widget, label_widget, value, text):
+        """Applies one meter reading, only touching the progressbar value, label or bootstyle when it changed."""
+        rounded_value = round(value, 1) # Finer changes aren't visible on a 75 px bar
+        bootstyle = self._progressbar_bootstyle(value)
+        last_value, last_text, last_bootstyle = self._meter_state.get(meter_name, (None, None, None))
+        if rounded_value != last_value:
+            progressbar_widget['value'] = rounded_value
+        if text != last_text:
+            label_widget.config(text=text)
+        if bootstyle != last_bootstyle: # Restyling makes ttk recompute the widget style
+            progressbar_widget.config(bootstyle=bootstyle)
+        self._meter_state[meter_name] = (rounded_value, text, bootstyle)
+
+    def _progressbar_bootstyle(self, value):
+        """Returns the Progressbar bootstyle for a meter value."""
         if value < 50:
-            progressbar_widget.config(bootstyle="success")
+            return "success"
         elif 50 <= value < 75: 
-            progressbar_widget.config(bootstyle="info") 
+            return "info" 
         elif 75 <= value < 90: 
-            progressbar_widget.config(bootstyle="warning")
+            return "warning"
         else: # 90% and above
-            progressbar_widget.config(bootstyle="danger")
+            return "danger"
 
 
 if __name__ == '__main__':
     root = ttkb.Window()
+    root.update_idletasks() # Put the window on screen before the app builds its widgets
     app = FFmpegStreamerApp(root)
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
     root.mainloop()